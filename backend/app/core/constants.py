@@ -28,3 +28,11 @@ class UserRole(str, Enum):
     USER = "user"
     ADMIN = "admin"
 
+
+class EmailJobStatus(str, Enum):
+    """Outbound email job states."""
+
+    PENDING = "pending"
+    SENDING = "sending"
+    SENT = "sent"
+    DEAD = "dead"
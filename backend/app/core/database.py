@@ -1,24 +1,111 @@
 """Database configuration and session management."""
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
-from sqlalchemy.orm import declarative_base
+from typing import Callable
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.orm import Session, declarative_base
 
 from app.core.config import settings
 
-engine = create_async_engine(settings.DATABASE_URL, echo=True, future=True)
+
+def create_engine(url: str) -> AsyncEngine:
+    """Create an async engine with the configured pool and driver settings."""
+    options = {"echo": settings.DB_ECHO}
+    
+    # SQLite (e.g. a local file standing in for a replica) has no server pool to tune.
+    if url.startswith("sqlite"):
+        return create_async_engine(url, **options)
+    
+    options.update(
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+        pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+    )
+    
+    if url.startswith("postgresql+asyncpg"):
+        options["connect_args"] = {
+            "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+            "server_settings": {"statement_timeout": str(settings.DB_STATEMENT_TIMEOUT_MS)},
+        }
+    
+    return create_async_engine(url, **options)
+
+
+engine = create_engine(settings.DATABASE_URL)
+read_engine = create_engine(settings.DATABASE_READ_URL) if settings.DATABASE_READ_URL else engine
 AsyncSessionLocal = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+ReadSessionLocal = async_sessionmaker(read_engine, class_=AsyncSession, expire_on_commit=False)
 Base = declarative_base()
 
 
+@event.listens_for(Session, "after_flush")
+def _track_flush(session, flush_context):
+    session.info["has_writes"] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _track_write_statement(orm_execute_state):
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        orm_execute_state.session.info["has_writes"] = True
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _reset_write_tracking(session):
+    session.info.pop("has_writes", None)
+
+
+@event.listens_for(Session, "after_commit")
+def _run_after_commit_callbacks(session):
+    for callback in session.info.pop("after_commit_callbacks", ()):
+        callback()
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_after_commit_callbacks(session):
+    session.info.pop("after_commit_callbacks", None)
+
+
+def run_after_commit(session: AsyncSession, callback: Callable[[], None]) -> None:
+    """Run ``callback`` once the session's transaction commits; it is dropped on rollback."""
+    session.info.setdefault("after_commit_callbacks", []).append(callback)
+
+
+def has_pending_writes(session: AsyncSession) -> bool:
+    """Check whether the session's transaction has anything worth committing."""
+    return bool(session.info.get("has_writes") or session.new or session.dirty or session.deleted)
+
+
 async def get_db():
-    """Get database session."""
+    """Get database session.
+
+    The transaction is committed only if the request wrote something; a
+    request that only read is rolled back on close, saving a round-trip.
+    """
     async with AsyncSessionLocal() as session:
         try:
             yield session
-            await session.commit()
+            if has_pending_writes(session):
+                await session.commit()
         except Exception:
             await session.rollback()
             raise
         finally:
             await session.close()
 
+
+async def get_read_db():
+    """Get a read-only database session on the replica, or the primary if none is configured.
+
+    Nothing is committed. Replicas may lag the primary slightly, so use this
+    only for reads that can tolerate that.
+    """
+    async with ReadSessionLocal() as session:
+        try:
+            yield session
+        finally:
+            await session.rollback()
+            await session.close()
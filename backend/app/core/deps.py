@@ -5,7 +5,8 @@ from typing import Annotated
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
 
 DBSession = Annotated[AsyncSession, Depends(get_db)]
+ReadDBSession = Annotated[AsyncSession, Depends(get_read_db)]
 
@@ -44,3 +44,10 @@ class ValidationException(HTTPException):
     def __init__(self, detail: str = "Validation failed"):
         super().__init__(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=detail)
 
+
+
+class ServiceUnavailableException(HTTPException):
+    """Temporary overload or dependency failure exception."""
+
+    def __init__(self, detail: str = "Service temporarily unavailable"):
+        super().__init__(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=detail)
@@ -0,0 +1,157 @@
+"""Bounded worker pools for running blocking work off the event loop."""
+
+import asyncio
+import multiprocessing
+import threading
+from concurrent.futures import BrokenExecutor, Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable
+
+from app.core.exceptions import ServiceUnavailableException
+from app.core.logging import logger
+
+
+def _noop() -> None:
+    """Do nothing; submitted to force pool workers to start."""
+
+
+class BoundedExecutor:
+    """Worker pool with a queue-depth limit and a per-job timeout.
+
+    Jobs beyond ``max_workers + max_pending`` in flight are rejected with a 503
+    instead of queueing without bound, so a burst of slow work cannot pile up
+    behind the pool and exhaust memory.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_workers: int,
+        max_pending: int,
+        timeout: float,
+        use_processes: bool = False,
+        initializer: Callable[[], Any] | None = None,
+    ):
+        self.name = name
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self.use_processes = use_processes
+        self.initializer = initializer
+        self._executor: Executor | None = None
+        self._lock = threading.RLock()
+        self._in_flight = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Number of jobs currently running or waiting for a worker."""
+        return self._in_flight
+
+    def start(self) -> None:
+        """Create the underlying pool if it is not running yet."""
+        with self._lock:
+            self._start()
+
+    def _start(self) -> None:
+        if self._executor is not None:
+            return
+
+        if self.use_processes:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=self.initializer,
+            )
+        else:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix=self.name.replace(" ", "-"),
+                initializer=self.initializer,
+            )
+        logger.info(f"Started {self.name} pool with {self.max_workers} workers")
+
+    async def warm_up(self) -> None:
+        """Start the pool and bring every worker up, running its initializer.
+
+        A failed warm-up is logged and the pool rebuilt, so the app still
+        starts and jobs get a fresh pool instead of a broken one.
+        """
+        self.start()
+        executor = self._executor
+        loop = asyncio.get_running_loop()
+        try:
+            await asyncio.gather(
+                *(loop.run_in_executor(executor, _noop) for _ in range(self.max_workers))
+            )
+        except BrokenExecutor:
+            self._restart(executor)
+
+    def shutdown(self) -> None:
+        """Stop the pool, cancelling jobs that have not started."""
+        with self._lock:
+            if self._executor is None:
+                return
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        logger.info(f"Stopped {self.name} pool")
+
+    def _restart(self, broken: Executor) -> None:
+        """Replace a pool that broke, unless another caller already did."""
+        with self._lock:
+            if self._executor is not broken:
+                return
+            logger.error(f"{self.name} pool is broken (a worker died or failed to start), restarting it")
+            broken.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+            self._start()
+
+    def _release_when_done(self, future: Future, loop: asyncio.AbstractEventLoop) -> None:
+        """Free the job's slot once the worker is actually done with it."""
+
+        def release(_future: Future) -> None:
+            try:
+                loop.call_soon_threadsafe(self._release)
+            except RuntimeError:
+                # The loop has already closed, so there is nothing left to account for.
+                pass
+
+        future.add_done_callback(release)
+
+    def _release(self) -> None:
+        self._in_flight -= 1
+
+    async def run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run ``func`` in the pool and await its result.
+
+        A job that times out keeps its slot until the worker finishes it, so
+        abandoned jobs still count against the queue limit. A job that has
+        started cannot be cancelled, so a timed-out job also keeps its worker
+        busy until it completes. If the pool breaks because a worker process
+        died, it is rebuilt and the job is retried once before giving up
+        with a 503.
+        """
+        if self._in_flight >= self.max_workers + self.max_pending:
+            logger.warning(f"{self.name} queue full ({self._in_flight} jobs in flight)")
+            raise ServiceUnavailableException(f"{self.name} is busy, please retry shortly")
+
+        job = partial(func, *args, **kwargs)
+        for attempt in range(2):
+            self.start()
+            executor = self._executor
+            try:
+                future = executor.submit(job)
+            except BrokenExecutor:
+                self._restart(executor)
+                continue
+
+            self._in_flight += 1
+            self._release_when_done(future, asyncio.get_running_loop())
+            try:
+                return await asyncio.wait_for(asyncio.wrap_future(future), timeout=self.timeout)
+            except asyncio.TimeoutError:
+                logger.error(f"{self.name} job timed out after {self.timeout}s")
+                raise ServiceUnavailableException(f"{self.name} timed out")
+            except BrokenExecutor:
+                self._restart(executor)
+
+        raise ServiceUnavailableException(f"{self.name} is unavailable, please retry shortly")
@@ -0,0 +1,134 @@
+"""Shared outbound HTTP client."""
+
+import importlib.util
+import time
+
+import httpx
+
+from app.core.config import settings
+from app.core.exceptions import ServiceUnavailableException
+from app.core.logging import logger
+
+
+class CircuitOpenError(ServiceUnavailableException):
+    """Raised when calls to a failing host are short-circuited."""
+
+    def __init__(self, host: str):
+        super().__init__(detail=f"Upstream service {host} is unavailable")
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker for one upstream host.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    calls fail fast for ``reset_timeout`` seconds; then a single trial call
+    is let through, closing the circuit again if it succeeds.
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: float | None = None
+
+    def allow(self) -> bool:
+        """Check whether a call may be attempted."""
+        if self.opened_at is None:
+            return True
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            # Half-open: let one trial call through and re-arm the timer.
+            self.opened_at = time.monotonic()
+            return True
+        return False
+
+    def record_success(self) -> None:
+        """Close the circuit."""
+        self.failures = 0
+        self.opened_at = None
+
+    def record_failure(self) -> None:
+        """Count a failure, opening the circuit at the threshold."""
+        self.failures += 1
+        if self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+
+
+class OutboundHTTP:
+    """Application-wide HTTP client with pooled keep-alive connections.
+
+    One ``httpx.AsyncClient`` is shared by every integration so connections
+    (and their DNS, TCP and TLS setup) are reused across requests. Each host
+    gets its own timeout and circuit breaker.
+    """
+
+    def __init__(self):
+        self._client: httpx.AsyncClient | None = None
+        self._breakers: dict[str, CircuitBreaker] = {}
+
+    @staticmethod
+    def _http2_available() -> bool:
+        return settings.HTTP2_ENABLED and importlib.util.find_spec("h2") is not None
+
+    def start(self) -> None:
+        """Create the pooled client."""
+        if self._client is not None:
+            return
+        self._client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=settings.HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY_SECONDS,
+            ),
+            timeout=settings.HTTP_TIMEOUT_SECONDS,
+            http2=self._http2_available(),
+        )
+        logger.info("Started outbound HTTP client")
+
+    async def close(self) -> None:
+        """Close pooled connections."""
+        if self._client is None:
+            return
+        await self._client.aclose()
+        self._client = None
+        logger.info("Closed outbound HTTP client")
+
+    def _breaker(self, host: str) -> CircuitBreaker:
+        if host not in self._breakers:
+            self._breakers[host] = CircuitBreaker(
+                settings.HTTP_CIRCUIT_FAILURE_THRESHOLD,
+                settings.HTTP_CIRCUIT_RESET_SECONDS,
+            )
+        return self._breakers[host]
+
+    async def request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """Send a request through the shared pool, guarded by the host's circuit breaker."""
+        self.start()
+        host = httpx.URL(url).host
+        breaker = self._breaker(host)
+
+        if not breaker.allow():
+            raise CircuitOpenError(host)
+
+        kwargs.setdefault("timeout", settings.HTTP_HOST_TIMEOUTS.get(host, settings.HTTP_TIMEOUT_SECONDS))
+        try:
+            response = await self._client.request(method, url, **kwargs)
+        except httpx.TransportError:
+            breaker.record_failure()
+            raise
+
+        if response.status_code >= 500:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+        return response
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        """Send a GET request."""
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> httpx.Response:
+        """Send a POST request."""
+        return await self.request("POST", url, **kwargs)
+
+
+outbound_http = OutboundHTTP()
@@ -0,0 +1,56 @@
+"""Background task helpers."""
+
+import asyncio
+from typing import Awaitable, Callable
+
+from app.core.logging import logger
+
+
+class PeriodicTask:
+    """Run an async callable on a fixed interval for the lifetime of the app.
+
+    ``trigger()`` wakes the loop early, so producers can get work picked up
+    without waiting for the next tick.
+    """
+
+    def __init__(self, name: str, interval: float, func: Callable[[], Awaitable[object]]):
+        self.name = name
+        self.interval = interval
+        self.func = func
+        self._task: asyncio.Task | None = None
+        self._wake = asyncio.Event()
+
+    def start(self) -> None:
+        """Start the background loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name=self.name)
+            logger.info(f"Started background task {self.name}")
+
+    async def stop(self) -> None:
+        """Cancel the background loop and wait for it to exit."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        logger.info(f"Stopped background task {self.name}")
+
+    def trigger(self) -> None:
+        """Run the next iteration as soon as possible."""
+        self._wake.set()
+
+    async def _run(self) -> None:
+        while True:
+            self._wake.clear()
+            try:
+                await self.func()
+            except Exception as e:
+                logger.error(f"Background task {self.name} failed: {str(e)}", exc_info=True)
+
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.interval)
+            except asyncio.TimeoutError:
+                pass
@@ -1,10 +1,13 @@
 """FastAPI application entry point."""
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.config import settings
+from app.core.http import outbound_http
 from app.core.logging import setup_logging
 from app.core.handlers import validation_exception_handler, global_exception_handler
 from app.routes.auth import router as auth_router
@@ -12,8 +15,15 @@ from app.routes.client import router as client_router
 from app.routes.currency import router as currency_router
 from app.routes.health import router as health_router
 from app.routes.invoice import router as invoice_router
+from app.routes.invoice_bulk import router as invoice_bulk_router
 from app.routes.invoice_operations import router as invoice_operations_router
+from app.routes.report import router as report_router
 from app.routes.template import router as template_router
+from app.services.email_queue import email_worker
+from app.services.overdue import overdue_sweeper
+from app.services.pdf import pdf_executor, warm_up_pdf_renderer
+from app.services.pdf_cache import pdf_cache_sweeper
+from app.utils.auth import password_executor
 
 setup_logging()
 
@@ -24,12 +34,31 @@ A modern invoice generation platform with user authentication, client management
 and automated invoice creation with PDF generation and email delivery.
 """
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start and stop application-wide resources."""
+    outbound_http.start()
+    await warm_up_pdf_renderer()
+    email_worker.start()
+    overdue_sweeper.start()
+    pdf_cache_sweeper.start()
+    yield
+    await pdf_cache_sweeper.stop()
+    await overdue_sweeper.stop()
+    await email_worker.stop()
+    pdf_executor.shutdown()
+    password_executor.shutdown()
+    await outbound_http.close()
+
+
 app = FastAPI(
     title=settings.PROJECT_NAME,
     version=settings.VERSION,
     description=description,
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
     swagger_ui_parameters={"defaultModelsExpandDepth": -1},
+    lifespan=lifespan,
 )
 
 app.add_exception_handler(RequestValidationError, validation_exception_handler)
@@ -48,8 +77,10 @@ app.include_router(health_router)
 app.include_router(auth_router, prefix=settings.API_V1_STR)
 app.include_router(client_router, prefix=settings.API_V1_STR)
 app.include_router(currency_router, prefix=settings.API_V1_STR)
+app.include_router(invoice_bulk_router, prefix=settings.API_V1_STR)
 app.include_router(invoice_router, prefix=settings.API_V1_STR)
 app.include_router(invoice_operations_router, prefix=settings.API_V1_STR)
+app.include_router(report_router, prefix=settings.API_V1_STR)
 app.include_router(template_router, prefix=settings.API_V1_STR)
 
 
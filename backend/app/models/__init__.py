@@ -2,10 +2,13 @@
 
 from app.core.database import Base
 from app.models.client import Client
+from app.models.email_job import EmailJob
 from app.models.invoice import Invoice
+from app.models.invoice_aggregate import InvoiceAggregate
+from app.models.invoice_counter import InvoiceCounter
 from app.models.line_item import LineItem
 from app.models.template import Template
 from app.models.user import User
 
-__all__ = ["Base", "User", "Client", "Invoice", "LineItem", "Template"]
+__all__ = ["Base", "User", "Client", "Invoice", "LineItem", "Template", "EmailJob", "InvoiceCounter", "InvoiceAggregate"]
 
@@ -0,0 +1,32 @@
+"""Email job model."""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, Enum, ForeignKey, Index, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.core.constants import EmailJobStatus
+from app.core.database import Base
+
+
+class EmailJob(Base):
+    """Queued outbound invoice email, delivered by the background email worker."""
+
+    __tablename__ = "email_jobs"
+    __table_args__ = (Index("ix_email_jobs_status_next_attempt_at", "status", "next_attempt_at"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id", ondelete="CASCADE"), index=True)
+    invoice_id: Mapped[int] = mapped_column(Integer, ForeignKey("invoices.id", ondelete="CASCADE"))
+    batch_id: Mapped[str] = mapped_column(String(32), nullable=True, index=True)
+    status: Mapped[EmailJobStatus] = mapped_column(Enum(EmailJobStatus), default=EmailJobStatus.PENDING)
+    attempts: Mapped[int] = mapped_column(Integer, default=0)
+    max_attempts: Mapped[int] = mapped_column(Integer)
+    next_attempt_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    last_error: Mapped[str] = mapped_column(Text, nullable=True)
+    provider_message_id: Mapped[str] = mapped_column(String(255), nullable=True)
+    sent_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    invoice: Mapped["Invoice"] = relationship("Invoice")
@@ -3,7 +3,7 @@
 from datetime import date, datetime
 from decimal import Decimal
 
-from sqlalchemy import Date, DateTime, Enum, ForeignKey, Integer, Numeric, String, Text
+from sqlalchemy import Date, DateTime, Enum, ForeignKey, Index, Integer, Numeric, String, Text, UniqueConstraint, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.constants import Currency, InvoiceStatus
@@ -14,14 +14,23 @@ class Invoice(Base):
     """Invoice model."""
 
     __tablename__ = "invoices"
+    __table_args__ = (
+        UniqueConstraint("user_id", "invoice_number", name="uq_invoices_user_id_invoice_number"),
+        Index("ix_invoices_user_id_status_issue_date", "user_id", "status", "issue_date"),
+        Index("ix_invoices_user_id_created_at_id", "user_id", "created_at", "id"),
+        Index("ix_invoices_user_id_client_id_issue_date", "user_id", "client_id", "issue_date"),
+        Index("ix_invoices_sent_due_date", "due_date", postgresql_where=text("status = 'SENT'")),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id", ondelete="CASCADE"))
-    client_id: Mapped[int] = mapped_column(Integer, ForeignKey("clients.id", ondelete="CASCADE"))
-    invoice_number: Mapped[str] = mapped_column(String(50), unique=True, index=True)
+    client_id: Mapped[int] = mapped_column(Integer, ForeignKey("clients.id", ondelete="CASCADE"), index=True)
+    invoice_number: Mapped[str] = mapped_column(String(50))
     status: Mapped[InvoiceStatus] = mapped_column(Enum(InvoiceStatus), default=InvoiceStatus.DRAFT)
     currency: Mapped[Currency] = mapped_column(Enum(Currency), default=Currency.USD)
-    amount: Mapped[Decimal] = mapped_column(Numeric(10, 2), default=0)
+    subtotal: Mapped[Decimal] = mapped_column(Numeric(12, 2), default=0)
+    tax_total: Mapped[Decimal] = mapped_column(Numeric(12, 2), default=0)
+    amount: Mapped[Decimal] = mapped_column(Numeric(12, 2), default=0)
     template_name: Mapped[str] = mapped_column(String(100), default="invoice_template.html", nullable=True)
     issue_date: Mapped[date] = mapped_column(Date)
     due_date: Mapped[date] = mapped_column(Date)
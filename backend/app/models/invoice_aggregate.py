@@ -0,0 +1,28 @@
+"""Invoice aggregate model."""
+
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import Date, Enum, ForeignKey, Integer, Numeric
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.constants import Currency, InvoiceStatus
+from app.core.database import Base
+
+
+class InvoiceAggregate(Base):
+    """Running invoice count and total per user, client, status, currency and issue month.
+
+    Maintained incrementally by the invoice service so the dashboard summary
+    reads a handful of rows instead of scanning invoices.
+    """
+
+    __tablename__ = "invoice_aggregates"
+
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    client_id: Mapped[int] = mapped_column(Integer, ForeignKey("clients.id", ondelete="CASCADE"), primary_key=True)
+    status: Mapped[InvoiceStatus] = mapped_column(Enum(InvoiceStatus), primary_key=True)
+    currency: Mapped[Currency] = mapped_column(Enum(Currency), primary_key=True)
+    month: Mapped[date] = mapped_column(Date, primary_key=True)
+    invoice_count: Mapped[int] = mapped_column(Integer, default=0)
+    total_amount: Mapped[Decimal] = mapped_column(Numeric(14, 2), default=0)
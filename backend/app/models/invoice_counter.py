@@ -0,0 +1,16 @@
+"""Invoice counter model."""
+
+from sqlalchemy import ForeignKey, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class InvoiceCounter(Base):
+    """Last invoice number issued per user and year."""
+
+    __tablename__ = "invoice_counters"
+
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    year: Mapped[int] = mapped_column(Integer, primary_key=True)
+    last_value: Mapped[int] = mapped_column(Integer, default=0)
@@ -4,7 +4,9 @@ from app.routes.auth import router as auth_router
 from app.routes.client import router as client_router
 from app.routes.health import router as health_router
 from app.routes.invoice import router as invoice_router
+from app.routes.invoice_bulk import router as invoice_bulk_router
 from app.routes.invoice_operations import router as invoice_operations_router
+from app.routes.report import router as report_router
 from app.routes.template import router as template_router
 
 __all__ = [
@@ -12,7 +14,9 @@ __all__ = [
     "health_router",
     "client_router",
     "invoice_router",
+    "invoice_bulk_router",
     "invoice_operations_router",
+    "report_router",
     "template_router",
 ]
 
@@ -1,12 +1,20 @@
 """Authentication routes."""
 
 from fastapi import APIRouter
+from sqlalchemy import inspect
 
 from app.core.deps import DBSession
 from app.core.exceptions import UnauthorizedException
 from app.schemas.auth import TokenRefresh, TokenResponse, UserLogin, UserRegister
 from app.schemas.user import UserResponse, UserUpdate
-from app.services.auth import get_user_by_id, login_user, register_user, update_user
+from app.services.auth import (
+    get_user_by_id,
+    get_user_profile,
+    login_user,
+    register_user,
+    update_user,
+    user_snapshot,
+)
 from app.utils.auth import create_access_token, create_refresh_token, decode_token
 from app.utils.jwt import CurrentUser
 
@@ -39,6 +47,8 @@ async def refresh_token(data: TokenRefresh, db: DBSession):
         raise UnauthorizedException("Invalid token payload")
     
     user = await get_user_by_id(db, int(user_id))
+    if not user.is_active:
+        raise UnauthorizedException("Account is inactive")
     
     access_token = create_access_token({"sub": str(user.id)})
     refresh_token = create_refresh_token({"sub": str(user.id)})
@@ -49,8 +59,11 @@ async def refresh_token(data: TokenRefresh, db: DBSession):
 @router.get("/me", response_model=UserResponse)
 async def get_current_user(user_id: CurrentUser, db: DBSession):
     """Get current authenticated user."""
-    user = await get_user_by_id(db, user_id)
-    return user
+    user = await get_user_profile(db, user_id)
+    # The profile cache never holds is_active. Login and refresh only issue
+    # tokens to active accounts, so a cached profile is reported as active.
+    is_active = True if "is_active" in inspect(user).unloaded else user.is_active
+    return UserResponse(**user_snapshot(user), is_active=is_active)
 
 
 @router.put("/me", response_model=UserResponse)
@@ -2,7 +2,7 @@
 
 from fastapi import APIRouter, Depends, Query
 
-from app.core.deps import DBSession
+from app.core.deps import DBSession, ReadDBSession
 from app.schemas.client import ClientCreate, ClientResponse, ClientUpdate
 from app.services.client import (
     create_client,
@@ -31,21 +31,25 @@ async def create_client_endpoint(
 @router.get("", response_model=PaginatedResponse[ClientResponse])
 async def get_clients_endpoint(
     user_id: CurrentUser,
-    db: DBSession,
+    db: ReadDBSession,
     page: int = Query(1, ge=1),
     page_size: int = Query(10, ge=1, le=100),
+    cursor: str | None = Query(None, description="Cursor from a previous page's next_cursor"),
+    include_total: bool = True,
 ):
     """Get paginated list of clients."""
-    pagination = PaginationParams(page=page, page_size=page_size)
-    clients, total = await get_clients(db, user_id, pagination)
-    return PaginatedResponse.create(clients, total, page, page_size)
+    pagination = PaginationParams(
+        page=page, page_size=page_size, cursor=cursor, include_total=include_total
+    )
+    clients, total, next_cursor = await get_clients(db, user_id, pagination)
+    return PaginatedResponse.create(clients, total, page, page_size, next_cursor)
 
 
 @router.get("/{client_id}", response_model=ClientResponse)
 async def get_client_endpoint(
     client_id: int,
     user_id: CurrentUser,
-    db: DBSession,
+    db: ReadDBSession,
 ):
     """Get a client by ID."""
     client = await get_client_by_id(db, user_id, client_id)
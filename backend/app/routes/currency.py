@@ -1,6 +1,7 @@
 """Currency exchange rate routes."""
 from fastapi import APIRouter, Query
-from app.services.currency import get_exchange_rates, convert_currency
+from app.schemas.currency import BatchConversionRequest, BatchConversionResponse, ConversionResult
+from app.services.currency import get_exchange_rates, convert_currency, convert_currency_many
 
 router = APIRouter(prefix="/currency", tags=["Currency"])
 
@@ -25,3 +26,17 @@ async def convert(
         "to": to_currency,
         "converted_amount": converted_amount
     }
+
+
+@router.post("/convert/batch", response_model=BatchConversionResponse)
+async def convert_batch(data: BatchConversionRequest):
+    """Convert many amounts in one request."""
+    converted = await convert_currency_many(
+        [(item.amount, item.from_currency, item.to_currency) for item in data.items]
+    )
+    return BatchConversionResponse(
+        results=[
+            ConversionResult(**item.model_dump(), converted_amount=converted_amount)
+            for item, converted_amount in zip(data.items, converted)
+        ]
+    )
@@ -5,7 +5,7 @@ from datetime import date
 from fastapi import APIRouter, Query
 
 from app.core.constants import InvoiceStatus
-from app.core.deps import DBSession
+from app.core.deps import DBSession, ReadDBSession
 from app.schemas.invoice import InvoiceCreate, InvoiceListResponse, InvoiceResponse, InvoiceUpdate
 from app.services.invoice import (
     create_invoice,
@@ -35,25 +35,31 @@ async def create_invoice_endpoint(
 @router.get("", response_model=PaginatedResponse[InvoiceListResponse])
 async def get_invoices_endpoint(
     user_id: CurrentUser,
-    db: DBSession,
+    db: ReadDBSession,
     page: int = Query(1, ge=1),
     page_size: int = Query(10, ge=1, le=100),
+    cursor: str | None = Query(None, description="Cursor from a previous page's next_cursor"),
+    include_total: bool = True,
     status: InvoiceStatus | None = None,
     client_id: int | None = None,
     start_date: date | None = None,
     end_date: date | None = None,
 ):
     """Get paginated list of invoices with optional filters."""
-    pagination = PaginationParams(page=page, page_size=page_size)
-    invoices, total = await get_invoices(db, user_id, pagination, status, client_id, start_date, end_date)
-    return PaginatedResponse.create(invoices, total, page, page_size)
+    pagination = PaginationParams(
+        page=page, page_size=page_size, cursor=cursor, include_total=include_total
+    )
+    invoices, total, next_cursor = await get_invoices(
+        db, user_id, pagination, status, client_id, start_date, end_date
+    )
+    return PaginatedResponse.create(invoices, total, page, page_size, next_cursor)
 
 
 @router.get("/{invoice_id}", response_model=InvoiceResponse)
 async def get_invoice_endpoint(
     invoice_id: int,
     user_id: CurrentUser,
-    db: DBSession,
+    db: ReadDBSession,
 ):
     """Get an invoice by ID with line items."""
     invoice = await get_invoice_by_id(db, user_id, invoice_id)
@@ -0,0 +1,151 @@
+"""Invoice bulk routes (import, export, batch send)."""
+
+from collections import Counter
+from datetime import date
+from typing import Any
+
+from fastapi import APIRouter, Body, File, UploadFile
+from fastapi.responses import StreamingResponse
+
+from app.core.constants import InvoiceStatus
+from app.core.deps import DBSession, ReadDBSession
+from app.core.exceptions import BadRequestException
+from app.schemas.email_job import (
+    EmailBatchResponse,
+    EmailJobResponse,
+    InvoiceBatchSendRequest,
+    InvoiceBatchSendResponse,
+)
+from app.schemas.invoice import BulkInvoiceResponse
+from app.services.auth import get_user_profile
+from app.services.email_queue import email_worker, enqueue_invoice_email_batch, get_email_batch
+from app.services.export import stream_invoice_pdf_zip, stream_invoice_rows
+from app.services.invoice_import import bulk_create_invoices, parse_invoice_csv
+from app.utils.jwt import CurrentUser
+
+router = APIRouter(prefix="/invoices", tags=["Invoice Bulk Operations"])
+
+
+@router.post("/bulk", response_model=BulkInvoiceResponse)
+async def bulk_create_invoices_endpoint(
+    user_id: CurrentUser,
+    db: DBSession,
+    rows: list[dict[str, Any]] = Body(..., description="Invoices in the same shape as POST /invoices"),
+):
+    """Create many invoices, reporting invalid rows instead of failing the request."""
+    created, errors = await bulk_create_invoices(db, user_id, list(enumerate(rows)))
+    return BulkInvoiceResponse(created=created, errors=errors)
+
+
+@router.post("/bulk/csv", response_model=BulkInvoiceResponse)
+async def import_invoices_csv(
+    user_id: CurrentUser,
+    db: DBSession,
+    file: UploadFile = File(..., description="One line item per line, grouped into invoices by a reference column"),
+):
+    """Create invoices from a CSV upload, reporting invalid rows by line number."""
+    try:
+        content = (await file.read()).decode("utf-8-sig")
+    except UnicodeDecodeError:
+        raise BadRequestException("CSV file must be UTF-8 encoded")
+    
+    created, errors = await bulk_create_invoices(db, user_id, parse_invoice_csv(content))
+    return BulkInvoiceResponse(created=created, errors=errors)
+
+
+@router.get("/export/pdf")
+async def export_invoice_pdfs(
+    user_id: CurrentUser,
+    db: ReadDBSession,
+    status: InvoiceStatus | None = None,
+    client_id: int | None = None,
+    start_date: date | None = None,
+    end_date: date | None = None,
+):
+    """Download a ZIP of invoice PDFs matching the filters."""
+    user = await get_user_profile(db, user_id)
+
+    return StreamingResponse(
+        stream_invoice_pdf_zip(user, status, client_id, start_date, end_date),
+        media_type="application/zip",
+        headers={"Content-Disposition": "attachment; filename=invoices.zip"},
+    )
+
+
+@router.get("/export/csv")
+async def export_invoices_csv(
+    user_id: CurrentUser,
+    line_items: bool = False,
+    status: InvoiceStatus | None = None,
+    client_id: int | None = None,
+    start_date: date | None = None,
+    end_date: date | None = None,
+):
+    """Download invoices matching the filters as CSV, optionally one row per line item."""
+    return StreamingResponse(
+        stream_invoice_rows(user_id, "csv", line_items, status, client_id, start_date, end_date),
+        media_type="text/csv",
+        headers={"Content-Disposition": "attachment; filename=invoices.csv"},
+    )
+
+
+@router.get("/export/jsonl")
+async def export_invoices_jsonl(
+    user_id: CurrentUser,
+    line_items: bool = False,
+    status: InvoiceStatus | None = None,
+    client_id: int | None = None,
+    start_date: date | None = None,
+    end_date: date | None = None,
+):
+    """Download invoices matching the filters as JSON Lines, optionally one row per line item."""
+    return StreamingResponse(
+        stream_invoice_rows(user_id, "jsonl", line_items, status, client_id, start_date, end_date),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": "attachment; filename=invoices.jsonl"},
+    )
+
+
+@router.post("/send-batch", response_model=InvoiceBatchSendResponse, status_code=202)
+async def send_invoice_batch(
+    data: InvoiceBatchSendRequest,
+    user_id: CurrentUser,
+    db: DBSession,
+):
+    """Queue emails for many invoices at once."""
+    batch_id, queued_ids, missing_ids = await enqueue_invoice_email_batch(
+        db,
+        user_id,
+        data.invoice_ids,
+        data.status,
+        data.client_id,
+        data.start_date,
+        data.end_date,
+    )
+    # Commit before waking the worker so it can see the new jobs.
+    await db.commit()
+    email_worker.trigger()
+    
+    return InvoiceBatchSendResponse(
+        batch_id=batch_id,
+        queued=len(queued_ids),
+        missing_invoice_ids=missing_ids,
+    )
+
+
+@router.get("/send-batches/{batch_id}", response_model=EmailBatchResponse)
+async def get_invoice_batch_progress(
+    batch_id: str,
+    user_id: CurrentUser,
+    db: DBSession,
+):
+    """Get per-invoice delivery progress of a batch send."""
+    jobs = await get_email_batch(db, user_id, batch_id)
+    counts = Counter(job.status for job in jobs)
+    
+    return EmailBatchResponse(
+        batch_id=batch_id,
+        total=len(jobs),
+        counts=counts,
+        jobs=[EmailJobResponse.model_validate(job) for job in jobs],
+    )
@@ -1,62 +1,88 @@
 """Invoice operations routes (PDF, Email, Clone)."""
 
-from fastapi import APIRouter, Response
+from fastapi import APIRouter, Request, Response
 
 from app.core.deps import DBSession
+from app.schemas.email_job import EmailJobResponse, InvoiceSendResponse
 from app.schemas.invoice import InvoiceResponse
-from app.services.client import get_client_by_id
-from app.services.email import send_invoice_email
-from app.services.invoice import clone_invoice, get_invoice_by_id
-from app.services.pdf import generate_invoice_pdf
-from app.services.auth import get_user_by_id
+from app.services.auth import get_user_profile
+from app.services.email_queue import email_worker, enqueue_invoice_email, get_email_job
+from app.services.invoice import clone_invoice, get_invoice_detail
+from app.services.pdf import invoice_render_key, render_invoice_pdf
 from app.utils.jwt import CurrentUser
 
 router = APIRouter(prefix="/invoices", tags=["Invoice Operations"])
 
 
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check whether an If-None-Match header matches an ETag."""
+    if not if_none_match:
+        return False
+    candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
+
 @router.get("/{invoice_id}/pdf")
 async def download_invoice_pdf(
     invoice_id: int,
+    request: Request,
     user_id: CurrentUser,
     db: DBSession,
 ):
     """Generate and download invoice PDF."""
-    invoice = await get_invoice_by_id(db, user_id, invoice_id)
-    client = await get_client_by_id(db, user_id, invoice.client_id)
-    user = await get_user_by_id(db, user_id)
+    invoice = await get_invoice_detail(db, user_id, invoice_id)
+    user = await get_user_profile(db, user_id)
+    
+    render_key = invoice_render_key(invoice, invoice.client, user, invoice.template_name)
+    etag = f'"{render_key}"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
     
-    pdf_bytes = generate_invoice_pdf(invoice, client, user, invoice.template_name)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    
+    pdf_bytes = await render_invoice_pdf(
+        invoice, invoice.client, user, invoice.template_name, render_key
+    )
     
     return Response(
         content=pdf_bytes,
         media_type="application/pdf",
         headers={
-            "Content-Disposition": f"attachment; filename=invoice_{invoice.invoice_number}.pdf"
+            "Content-Disposition": f"attachment; filename=invoice_{invoice.invoice_number}.pdf",
+            **headers,
         },
     )
 
 
-@router.post("/{invoice_id}/send")
+@router.post("/{invoice_id}/send", response_model=InvoiceSendResponse, status_code=202)
 async def send_invoice(
     invoice_id: int,
     user_id: CurrentUser,
     db: DBSession,
 ):
-    """Send invoice via email with PDF attachment."""
-    invoice = await get_invoice_by_id(db, user_id, invoice_id)
-    client = await get_client_by_id(db, user_id, invoice.client_id)
-    user = await get_user_by_id(db, user_id)
-    
-    pdf_bytes = generate_invoice_pdf(invoice, client, user, invoice.template_name)
+    """Queue invoice email with PDF attachment for delivery."""
+    job = await enqueue_invoice_email(db, user_id, invoice_id)
+    # Commit before waking the worker so it can see the new job.
+    await db.commit()
+    email_worker.trigger()
     
-    success = await send_invoice_email(
-        invoice=invoice,
-        client=client,
-        company_name=user.company_name or user.username,
-        pdf_content=pdf_bytes,
+    return InvoiceSendResponse(
+        success=True,
+        message="Invoice queued for delivery",
+        job_id=job.id,
+        status=job.status,
     )
-    
-    return {"success": success, "message": "Invoice sent successfully" if success else "Failed to send invoice"}
+
+
+@router.get("/email-jobs/{job_id}", response_model=EmailJobResponse)
+async def get_email_job_endpoint(
+    job_id: int,
+    user_id: CurrentUser,
+    db: DBSession,
+):
+    """Get delivery status of a queued invoice email."""
+    job = await get_email_job(db, user_id, job_id)
+    return job
 
 
 @router.post("/{invoice_id}/clone", response_model=InvoiceResponse)
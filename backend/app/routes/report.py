@@ -0,0 +1,19 @@
+"""Report routes."""
+
+from fastapi import APIRouter
+
+from app.core.deps import ReadDBSession
+from app.schemas.report import InvoiceSummaryResponse
+from app.services.report import get_invoice_summary
+from app.utils.jwt import CurrentUser
+
+router = APIRouter(prefix="/reports", tags=["Reports"])
+
+
+@router.get("/summary", response_model=InvoiceSummaryResponse)
+async def get_summary(
+    user_id: CurrentUser,
+    db: ReadDBSession,
+):
+    """Get invoice totals by status, currency, month and client."""
+    return await get_invoice_summary(db, user_id)
@@ -2,7 +2,7 @@
 
 from fastapi import APIRouter
 
-from app.core.deps import DBSession
+from app.core.deps import DBSession, ReadDBSession
 from app.schemas.template import TemplateCreate, TemplateResponse, TemplateUpdate
 from app.services.template import (
     create_template,
@@ -31,7 +31,7 @@ async def create_template_endpoint(
 @router.get("", response_model=list[TemplateResponse])
 async def get_templates_endpoint(
     user_id: CurrentUser,
-    db: DBSession,
+    db: ReadDBSession,
 ):
     """Get all templates."""
     templates = await get_templates(db, user_id)
@@ -41,7 +41,7 @@ async def get_templates_endpoint(
 @router.get("/default", response_model=TemplateResponse | None)
 async def get_default_template_endpoint(
     user_id: CurrentUser,
-    db: DBSession,
+    db: ReadDBSession,
 ):
     """Get default template."""
     template = await get_default_template(db, user_id)
@@ -52,7 +52,7 @@ async def get_default_template_endpoint(
 async def get_template_endpoint(
     template_id: int,
     user_id: CurrentUser,
-    db: DBSession,
+    db: ReadDBSession,
 ):
     """Get a template by ID."""
     template = await get_template_by_id(db, user_id, template_id)
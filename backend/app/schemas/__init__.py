@@ -2,13 +2,37 @@
 
 from app.schemas.auth import TokenRefresh, TokenResponse, UserLogin, UserRegister
 from app.schemas.client import ClientCreate, ClientResponse, ClientUpdate
+from app.schemas.currency import (
+    BatchConversionRequest,
+    BatchConversionResponse,
+    ConversionItem,
+    ConversionResult,
+)
+from app.schemas.email_job import (
+    EmailBatchResponse,
+    EmailJobResponse,
+    InvoiceBatchSendRequest,
+    InvoiceBatchSendResponse,
+    InvoiceSendResponse,
+)
 from app.schemas.invoice import (
+    BulkInvoiceCreated,
+    BulkInvoiceError,
+    BulkInvoiceResponse,
     InvoiceCreate,
     InvoiceListResponse,
     InvoiceResponse,
     InvoiceUpdate,
     LineItemCreate,
     LineItemResponse,
+    LineItemUpdate,
+)
+from app.schemas.report import (
+    ClientSummary,
+    CurrencySummary,
+    InvoiceSummaryResponse,
+    MonthSummary,
+    StatusSummary,
 )
 from app.schemas.template import TemplateCreate, TemplateResponse, TemplateUpdate
 from app.schemas.user import UserResponse
@@ -22,12 +46,30 @@ __all__ = [
     "ClientCreate",
     "ClientUpdate",
     "ClientResponse",
+    "ConversionItem",
+    "ConversionResult",
+    "BatchConversionRequest",
+    "BatchConversionResponse",
+    "EmailJobResponse",
+    "EmailBatchResponse",
+    "InvoiceSendResponse",
+    "InvoiceBatchSendRequest",
+    "InvoiceBatchSendResponse",
     "InvoiceCreate",
     "InvoiceUpdate",
     "InvoiceResponse",
     "InvoiceListResponse",
+    "BulkInvoiceCreated",
+    "BulkInvoiceError",
+    "BulkInvoiceResponse",
     "LineItemCreate",
+    "LineItemUpdate",
     "LineItemResponse",
+    "InvoiceSummaryResponse",
+    "CurrencySummary",
+    "StatusSummary",
+    "MonthSummary",
+    "ClientSummary",
     "TemplateCreate",
     "TemplateUpdate",
     "TemplateResponse",
@@ -0,0 +1,33 @@
+"""Currency schemas."""
+
+from decimal import Decimal
+
+from pydantic import BaseModel, Field
+
+
+class ConversionItem(BaseModel):
+    """Single amount to convert."""
+
+    amount: Decimal
+    from_currency: str = Field(alias="from", min_length=3, max_length=3)
+    to_currency: str = Field(alias="to", min_length=3, max_length=3)
+
+    model_config = {"populate_by_name": True}
+
+
+class BatchConversionRequest(BaseModel):
+    """Batch conversion request schema."""
+
+    items: list[ConversionItem] = Field(min_length=1, max_length=1000)
+
+
+class ConversionResult(ConversionItem):
+    """Converted amount."""
+
+    converted_amount: Decimal
+
+
+class BatchConversionResponse(BaseModel):
+    """Batch conversion response schema."""
+
+    results: list[ConversionResult]
@@ -0,0 +1,64 @@
+"""Email job schemas."""
+
+from datetime import date, datetime
+
+from pydantic import BaseModel
+
+from app.core.constants import EmailJobStatus, InvoiceStatus
+
+
+class EmailJobResponse(BaseModel):
+    """Email job response schema."""
+
+    id: int
+    invoice_id: int
+    status: EmailJobStatus
+    attempts: int
+    max_attempts: int
+    next_attempt_at: datetime
+    last_error: str | None
+    sent_at: datetime | None
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = {"from_attributes": True}
+
+
+class InvoiceSendResponse(BaseModel):
+    """Invoice send response schema."""
+
+    success: bool
+    message: str
+    job_id: int
+    status: EmailJobStatus
+
+
+class InvoiceBatchSendRequest(BaseModel):
+    """Batch send request schema.
+
+    Invoices are selected by ``invoice_ids`` when given, narrowed by any of
+    the listing filters.
+    """
+
+    invoice_ids: list[int] | None = None
+    status: InvoiceStatus | None = None
+    client_id: int | None = None
+    start_date: date | None = None
+    end_date: date | None = None
+
+
+class InvoiceBatchSendResponse(BaseModel):
+    """Batch send response schema."""
+
+    batch_id: str
+    queued: int
+    missing_invoice_ids: list[int]
+
+
+class EmailBatchResponse(BaseModel):
+    """Email batch progress schema."""
+
+    batch_id: str
+    total: int
+    counts: dict[EmailJobStatus, int]
+    jobs: list[EmailJobResponse]
@@ -41,6 +41,15 @@ class LineItemCreate(BaseModel):
         return v
 
 
+class LineItemUpdate(LineItemCreate):
+    """Line item schema for invoice updates.
+
+    Items with an ``id`` update that line item; items without one are added.
+    """
+
+    id: int | None = None
+
+
 class LineItemResponse(BaseModel):
     """Line item response schema."""
 
@@ -49,6 +58,9 @@ class LineItemResponse(BaseModel):
     quantity: Decimal
     unit_price: Decimal
     tax_rate: Decimal
+    subtotal: Decimal
+    tax_amount: Decimal
+    total: Decimal
 
     model_config = {"from_attributes": True}
 
@@ -100,7 +112,7 @@ class InvoiceUpdate(BaseModel):
     template_name: str | None = None
     payment_terms: str | None = None
     notes: str | None = None
-    line_items: list[LineItemCreate] | None = None
+    line_items: list[LineItemUpdate] | None = None
 
 
 class ClientBasic(BaseModel):
@@ -123,6 +135,8 @@ class InvoiceResponse(BaseModel):
     invoice_number: str
     status: InvoiceStatus
     currency: Currency
+    subtotal: Decimal
+    tax_total: Decimal
     amount: Decimal
     template_name: str
     issue_date: date
@@ -146,6 +160,8 @@ class InvoiceListResponse(BaseModel):
     invoice_number: str
     status: InvoiceStatus
     currency: Currency
+    subtotal: Decimal
+    tax_total: Decimal
     amount: Decimal
     template_name: str
     issue_date: date
@@ -154,3 +170,30 @@ class InvoiceListResponse(BaseModel):
     updated_at: datetime
 
     model_config = {"from_attributes": True}
+
+
+class BulkInvoiceCreated(BaseModel):
+    """Invoice created by a bulk import."""
+
+    row: int
+    id: int
+    invoice_number: str
+
+
+class BulkInvoiceError(BaseModel):
+    """Validation error for one bulk import row."""
+
+    row: int
+    field: str | None = None
+    message: str
+
+
+class BulkInvoiceResponse(BaseModel):
+    """Bulk import response schema.
+
+    ``row`` is the index in the submitted JSON array, or for CSV uploads the
+    line number of the invoice's first line.
+    """
+
+    created: list[BulkInvoiceCreated]
+    errors: list[BulkInvoiceError]
@@ -0,0 +1,52 @@
+"""Report schemas."""
+
+from datetime import date
+from decimal import Decimal
+
+from pydantic import BaseModel
+
+from app.core.constants import Currency, InvoiceStatus
+
+
+class SummaryTotal(BaseModel):
+    """Invoice count and total in one currency."""
+
+    currency: Currency
+    invoice_count: int
+    total_amount: Decimal
+
+
+class CurrencySummary(SummaryTotal):
+    """Totals for one currency, split into paid, outstanding and overdue."""
+
+    revenue: Decimal
+    outstanding: Decimal
+    overdue: Decimal
+
+
+class StatusSummary(SummaryTotal):
+    """Totals for one status."""
+
+    status: InvoiceStatus
+
+
+class MonthSummary(SummaryTotal):
+    """Totals for invoices issued in one month."""
+
+    month: date
+
+
+class ClientSummary(SummaryTotal):
+    """Totals for one client."""
+
+    client_id: int
+    client_name: str
+
+
+class InvoiceSummaryResponse(BaseModel):
+    """Dashboard summary response schema."""
+
+    by_currency: list[CurrencySummary]
+    by_status: list[StatusSummary]
+    by_month: list[MonthSummary]
+    by_client: list[ClientSummary]
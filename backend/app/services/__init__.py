@@ -1,6 +1,6 @@
 """Business logic services."""
 
-from app.services.auth import get_user_by_id, login_user, register_user
+from app.services.auth import get_user_by_id, get_user_profile, login_user, register_user
 from app.services.client import (
     create_client,
     delete_client,
@@ -9,17 +9,30 @@ from app.services.client import (
     update_client,
 )
 from app.services.email import send_invoice_email
+from app.services.email_queue import (
+    enqueue_invoice_email,
+    enqueue_invoice_email_batch,
+    get_email_batch,
+    get_email_job,
+)
+from app.services.export import stream_invoice_pdf_zip, stream_invoice_rows
 from app.services.invoice import (
+    allocate_invoice_numbers,
     check_duplicate_invoice,
     clone_invoice,
     create_invoice,
     delete_invoice,
     get_invoice_by_id,
+    get_invoice_detail,
     get_invoices,
+    iter_invoice_batches,
     update_invoice,
     update_invoice_status,
 )
-from app.services.pdf import generate_invoice_pdf
+from app.services.invoice_import import bulk_create_invoices, parse_invoice_csv
+from app.services.overdue import mark_overdue_invoice_batch, sweep_overdue_invoices
+from app.services.pdf import generate_invoice_pdf, render_invoice_pdf
+from app.services.report import get_invoice_summary
 from app.services.template import (
     create_template,
     delete_template,
@@ -33,6 +46,7 @@ __all__ = [
     "register_user",
     "login_user",
     "get_user_by_id",
+    "get_user_profile",
     "create_client",
     "get_clients",
     "get_client_by_id",
@@ -41,11 +55,16 @@ __all__ = [
     "create_invoice",
     "get_invoices",
     "get_invoice_by_id",
+    "get_invoice_detail",
+    "iter_invoice_batches",
     "update_invoice",
     "delete_invoice",
     "update_invoice_status",
     "clone_invoice",
     "check_duplicate_invoice",
+    "allocate_invoice_numbers",
+    "bulk_create_invoices",
+    "parse_invoice_csv",
     "create_template",
     "get_templates",
     "get_template_by_id",
@@ -53,6 +72,16 @@ __all__ = [
     "delete_template",
     "get_default_template",
     "send_invoice_email",
+    "enqueue_invoice_email",
+    "get_email_job",
+    "enqueue_invoice_email_batch",
+    "get_email_batch",
+    "stream_invoice_pdf_zip",
+    "stream_invoice_rows",
     "generate_invoice_pdf",
+    "render_invoice_pdf",
+    "mark_overdue_invoice_batch",
+    "sweep_overdue_invoices",
+    "get_invoice_summary",
 ]
 
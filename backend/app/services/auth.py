@@ -1,39 +1,53 @@
 """Authentication service."""
 
-from sqlalchemy import select
+from sqlalchemy import inspect, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm.util import identity_key
 
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.database import run_after_commit
 from app.core.exceptions import BadRequestException, UnauthorizedException
 from app.models.user import User
 from app.schemas.auth import TokenResponse, UserLogin, UserRegister
 from app.schemas.user import UserUpdate
+from app.services.pdf_cache import pdf_cache
 from app.utils.auth import (
     create_access_token,
     create_refresh_token,
-    hash_password,
-    verify_password,
+    hash_password_async,
+    password_needs_rehash,
+    verify_password_async,
 )
 
+user_cache = TTLCache(settings.USER_CACHE_MAX_ENTRIES, settings.USER_CACHE_TTL_SECONDS)
+
+# Never cached, so a stale entry cannot revive an old password or account status.
+UNCACHED_USER_COLUMNS = {"hashed_password", "is_active"}
+
 
 async def register_user(db: AsyncSession, data: UserRegister) -> User:
     """Register a new user."""
-    result = await db.execute(select(User).where(User.email == data.email))
-    if result.scalar_one_or_none():
+    result = await db.execute(
+        select(User.email, User.username).where(
+            or_(User.email == data.email, User.username == data.username)
+        )
+    )
+    taken = result.all()
+    if any(row.email == data.email for row in taken):
         raise BadRequestException("Email already registered")
-
-    result = await db.execute(select(User).where(User.username == data.username))
-    if result.scalar_one_or_none():
+    if taken:
         raise BadRequestException("Username already taken")
 
     user = User(
         username=data.username,
         email=data.email,
-        hashed_password=hash_password(data.password),
+        hashed_password=await hash_password_async(data.password),
         company_name=data.company_name,
     )
     db.add(user)
     await db.flush()
-    await db.refresh(user)
     return user
 
 
@@ -42,27 +56,70 @@ async def login_user(db: AsyncSession, data: UserLogin) -> TokenResponse:
     result = await db.execute(select(User).where(User.email == data.email))
     user = result.scalar_one_or_none()
 
-    if not user or not verify_password(data.password, user.hashed_password):
+    if not user or not await verify_password_async(data.password, user.hashed_password):
         raise UnauthorizedException("Invalid email or password")
 
     if not user.is_active:
         raise UnauthorizedException("Account is inactive")
 
+    if password_needs_rehash(user.hashed_password):
+        user.hashed_password = await hash_password_async(data.password)
+
     access_token = create_access_token({"sub": str(user.id)})
     refresh_token = create_refresh_token({"sub": str(user.id)})
 
     return TokenResponse(access_token=access_token, refresh_token=refresh_token)
 
 
+def user_snapshot(user: User) -> dict:
+    """Copy a user's profile column values for caching."""
+    return {
+        attr.key: getattr(user, attr.key)
+        for attr in inspect(User).column_attrs
+        if attr.key not in UNCACHED_USER_COLUMNS
+    }
+
+
 async def get_user_by_id(db: AsyncSession, user_id: int) -> User:
-    """Get user by ID."""
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
+    """Get user by ID.
+
+    Reuses the instance if the session already loaded it, otherwise reads
+    the row, refreshing the profile cache on the way. Use this where
+    ``is_active`` or ``hashed_password`` is needed; profile reads go
+    through ``get_user_profile``.
+    """
+    user = db.identity_map.get(identity_key(User, user_id))
+    if user is not None:
+        return user
+    
+    user = await db.get(User, user_id)
     if not user:
         raise UnauthorizedException("User not found")
+    
+    user_cache.put(user_id, user_snapshot(user))
     return user
 
 
+async def get_user_profile(db: AsyncSession, user_id: int) -> User:
+    """Get a user for rendering, from the short-lived profile cache when possible.
+
+    A cached user is merged into the session without SQL. It carries the
+    profile columns only, so callers must not read ``is_active`` or
+    ``hashed_password`` from it; use ``get_user_by_id`` for those.
+    """
+    user = db.identity_map.get(identity_key(User, user_id))
+    if user is not None:
+        return user
+    
+    cached = user_cache.get(user_id)
+    if cached is not None:
+        user = User(**cached)
+        make_transient_to_detached(user)
+        return await db.merge(user, load=False)
+    
+    return await get_user_by_id(db, user_id)
+
+
 async def update_user(db: AsyncSession, user_id: int, data: UserUpdate) -> User:
     """Update user profile."""
     user = await get_user_by_id(db, user_id)
@@ -94,10 +151,17 @@ async def update_user(db: AsyncSession, user_id: int, data: UserUpdate) -> User:
     if data.new_password:
         if not data.current_password:
             raise BadRequestException("Current password is required")
-        if not verify_password(data.current_password, user.hashed_password):
+        if not await verify_password_async(data.current_password, user.hashed_password):
             raise BadRequestException("Current password is incorrect")
-        user.hashed_password = hash_password(data.new_password)
+        user.hashed_password = await hash_password_async(data.new_password)
 
     await db.flush()
-    await db.refresh(user)
+    
+    # Until the commit lands, other requests still read the old row, so only
+    # drop cached copies once it has.
+    def invalidate() -> None:
+        user_cache.invalidate(user_id)
+        pdf_cache.invalidate_user(user_id)
+    
+    run_after_commit(db, invalidate)
     return user
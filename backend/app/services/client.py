@@ -6,7 +6,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.exceptions import ForbiddenException, NotFoundException
 from app.models.client import Client
 from app.schemas.client import ClientCreate, ClientUpdate
-from app.utils.pagination import PaginationParams
+from app.services.pdf_cache import pdf_cache
+from app.utils.pagination import PaginationParams, apply_pagination, split_page
 
 
 async def create_client(db: AsyncSession, user_id: int, data: ClientCreate) -> Client:
@@ -14,29 +15,29 @@ async def create_client(db: AsyncSession, user_id: int, data: ClientCreate) -> C
     client = Client(user_id=user_id, **data.model_dump())
     db.add(client)
     await db.flush()
-    await db.refresh(client)
     return client
 
 
-async def get_clients(db: AsyncSession, user_id: int, pagination: PaginationParams) -> tuple[list[Client], int]:
+async def get_clients(
+    db: AsyncSession, user_id: int, pagination: PaginationParams
+) -> tuple[list[Client], int | None, str | None]:
     """Get paginated list of clients for a user."""
     query = select(Client).where(Client.user_id == user_id)
     
-    count_query = select(func.count()).select_from(Client).where(Client.user_id == user_id)
-    total = await db.scalar(count_query)
+    total = None
+    if pagination.include_total:
+        count_query = select(func.count()).select_from(Client).where(Client.user_id == user_id)
+        total = await db.scalar(count_query) or 0
     
-    result = await db.execute(
-        query.offset(pagination.offset).limit(pagination.limit).order_by(Client.created_at.desc())
-    )
-    clients = result.scalars().all()
+    result = await db.execute(apply_pagination(query, pagination, Client.created_at, Client.id))
+    clients, next_cursor = split_page(result.scalars().all(), pagination)
     
-    return list(clients), total or 0
+    return clients, total, next_cursor
 
 
 async def get_client_by_id(db: AsyncSession, user_id: int, client_id: int) -> Client:
     """Get a client by ID."""
-    result = await db.execute(select(Client).where(Client.id == client_id))
-    client = result.scalar_one_or_none()
+    client = await db.get(Client, client_id)
     
     if not client:
         raise NotFoundException("Client not found")
@@ -56,7 +57,7 @@ async def update_client(db: AsyncSession, user_id: int, client_id: int, data: Cl
         setattr(client, field, value)
     
     await db.flush()
-    await db.refresh(client)
+    pdf_cache.invalidate_client(user_id, client_id)
     return client
 
 
@@ -65,3 +66,4 @@ async def delete_client(db: AsyncSession, user_id: int, client_id: int) -> None:
     client = await get_client_by_id(db, user_id, client_id)
     await db.delete(client)
     await db.flush()
+    pdf_cache.invalidate_client(user_id, client_id)
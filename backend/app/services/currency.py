@@ -1,28 +1,137 @@
 """Currency exchange rate service."""
-import httpx
+import asyncio
+import time
+from decimal import Decimal
+
 from app.core.config import settings
+from app.core.http import OutboundHTTP, outbound_http
+from app.core.logging import logger
+
+
+class ExchangeRateCache:
+    """In-process cache of one upstream rate table, from which every pair is derived.
+
+    Only the pivot currency's table is fetched; rates for any other base are
+    cross rates computed from it. Fresh entries are served for ``ttl``
+    seconds, then served stale for up to ``stale_ttl`` more while a single
+    background refresh runs. Concurrent misses share one upstream request.
+    """
+
+    def __init__(self, http: OutboundHTTP, pivot: str, ttl: float, stale_ttl: float):
+        self.http = http
+        self.pivot = pivot
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._data: dict | None = None
+        self._fetched_at = 0.0
+        self._inflight: asyncio.Task | None = None
+
+    async def _fetch(self) -> dict:
+        if not settings.EXCHANGE_RATE_API_KEY:
+            raise ValueError("EXCHANGE_RATE_API_KEY not configured")
+
+        response = await self.http.get(f"{settings.EXCHANGE_RATE_API_URL}/{settings.EXCHANGE_RATE_API_KEY}/latest/{self.pivot}")
+        response.raise_for_status()
+        data = response.json()
+
+        self._data = data
+        self._fetched_at = time.monotonic()
+        return data
+
+    def _on_refresh_done(self, task: asyncio.Task) -> None:
+        self._inflight = None
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Exchange rate refresh failed: {str(task.exception())}")
+
+    def _refresh(self) -> asyncio.Task:
+        if self._inflight is None:
+            self._inflight = asyncio.create_task(self._fetch())
+            self._inflight.add_done_callback(self._on_refresh_done)
+        return self._inflight
+
+    async def get_table(self) -> dict:
+        """Get the pivot rate table, fetching or revalidating as needed."""
+        age = time.monotonic() - self._fetched_at
+
+        if self._data is not None and age < self.ttl:
+            return self._data
+
+        if self._data is not None and age < self.ttl + self.stale_ttl:
+            self._refresh()
+            return self._data
+
+        return await asyncio.shield(self._refresh())
+
+    async def get_rates(self, base_currency: str) -> dict[str, float]:
+        """Get conversion rates from a base currency to every known currency."""
+        data = await self.get_table()
+        pivot_rates = data["conversion_rates"]
+
+        base_rate = pivot_rates.get(base_currency)
+        if not base_rate:
+            raise ValueError(f"Exchange rate not found for {base_currency}")
+
+        return {code: rate / base_rate for code, rate in pivot_rates.items()}
+
+    def clear(self) -> None:
+        """Forget the cached table."""
+        self._data = None
+        self._fetched_at = 0.0
+
+
+rate_cache = ExchangeRateCache(
+    outbound_http,
+    settings.EXCHANGE_RATE_PIVOT,
+    ttl=settings.EXCHANGE_RATE_TTL_SECONDS,
+    stale_ttl=settings.EXCHANGE_RATE_STALE_SECONDS,
+)
 
 
 async def get_exchange_rates(base_currency: str = "NGN") -> dict:
     """Get exchange rates for a base currency."""
-    if not settings.EXCHANGE_RATE_API_KEY:
-        raise ValueError("EXCHANGE_RATE_API_KEY not configured")
-    
-    async with httpx.AsyncClient() as client:
-        response = await client.get(f"{settings.EXCHANGE_RATE_API_URL}/{settings.EXCHANGE_RATE_API_KEY}/latest/{base_currency}")
-        response.raise_for_status()
-        return response.json()
+    data = await rate_cache.get_table()
+    rates = await rate_cache.get_rates(base_currency)
+
+    return {
+        "result": "success",
+        "base_code": base_currency,
+        "time_last_update_unix": data.get("time_last_update_unix"),
+        "time_last_update_utc": data.get("time_last_update_utc"),
+        "time_next_update_unix": data.get("time_next_update_unix"),
+        "time_next_update_utc": data.get("time_next_update_utc"),
+        "conversion_rates": rates,
+    }
 
 
 async def convert_currency(amount: float, from_currency: str, to_currency: str) -> float:
     """Convert amount from one currency to another."""
     if from_currency == to_currency:
         return amount
-    
-    rates_data = await get_exchange_rates(from_currency)
-    rate = rates_data["conversion_rates"].get(to_currency)
-    
+
+    rates = await rate_cache.get_rates(from_currency)
+    rate = rates.get(to_currency)
+
     if not rate:
         raise ValueError(f"Exchange rate not found for {to_currency}")
-    
+
     return round(amount * rate, 2)
+
+
+async def convert_currency_many(items: list[tuple[Decimal, str, str]]) -> list[Decimal]:
+    """Convert many (amount, from, to) tuples using one rate table lookup."""
+    data = await rate_cache.get_table()
+    pivot_rates = data["conversion_rates"]
+
+    currencies = {code for _, from_currency, to_currency in items for code in (from_currency, to_currency)}
+    rates = {}
+    for code in currencies:
+        rate = pivot_rates.get(code)
+        if not rate:
+            raise ValueError(f"Exchange rate not found for {code}")
+        rates[code] = Decimal(str(rate))
+
+    cent = Decimal("0.01")
+    return [
+        (amount if from_currency == to_currency else amount * rates[to_currency] / rates[from_currency]).quantize(cent)
+        for amount, from_currency, to_currency in items
+    ]
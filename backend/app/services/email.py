@@ -1,22 +1,164 @@
 """Email service using Resend."""
 
+import asyncio
 import base64
 from pathlib import Path
+from typing import Protocol
 
-import resend
 from jinja2 import Environment, FileSystemLoader
 
 from app.core.config import settings
+from app.core.http import OutboundHTTP, outbound_http
 from app.core.logging import logger
 from app.models.client import Client
 from app.models.invoice import Invoice
 
-resend.api_key = settings.RESEND_API_KEY
-
 template_dir = Path(__file__).parent.parent / "templates" / "email"
 jinja_env = Environment(loader=FileSystemLoader(template_dir))
 
 
+class EmailTransport(Protocol):
+    """Delivers prepared email messages."""
+
+    async def send(self, message: dict) -> str | None:
+        """Send a message and return the provider message ID."""
+        ...
+
+    async def send_batch(self, messages: list[dict]) -> list[str | None | Exception]:
+        """Send several messages, returning a message ID or error per message."""
+        ...
+
+
+class ResendTransport:
+    """Transport delivering through the Resend REST API over the shared HTTP pool."""
+
+    BATCH_LIMIT = 100
+
+    def __init__(self, http: OutboundHTTP):
+        self.http = http
+
+    async def _post(self, path: str, payload: dict | list) -> dict:
+        response = await self.http.post(
+            f"{settings.RESEND_API_URL}{path}",
+            json=payload,
+            headers={"Authorization": f"Bearer {settings.RESEND_API_KEY}"},
+        )
+        response.raise_for_status()
+        return response.json()
+
+    async def send(self, message: dict) -> str | None:
+        """Send a message."""
+        result = await self._post("/emails", message)
+        return result.get("id")
+
+    async def send_batch(self, messages: list[dict]) -> list[str | None | Exception]:
+        """Send messages, grouping those without attachments into batch calls.
+
+        Resend's batch endpoint does not accept attachments, so messages
+        carrying a PDF are sent individually, concurrently.
+        """
+        results: list[str | None | Exception] = [None] * len(messages)
+        plain = [i for i, message in enumerate(messages) if not message.get("attachments")]
+        with_attachments = [i for i, message in enumerate(messages) if message.get("attachments")]
+
+        for start in range(0, len(plain), self.BATCH_LIMIT):
+            chunk = plain[start:start + self.BATCH_LIMIT]
+            try:
+                response = await self._post("/emails/batch", [messages[i] for i in chunk])
+                for i, sent in zip(chunk, response["data"]):
+                    results[i] = sent.get("id")
+            except Exception as e:
+                for i in chunk:
+                    results[i] = e
+
+        sent = await asyncio.gather(
+            *(self.send(messages[i]) for i in with_attachments), return_exceptions=True
+        )
+        for i, result in zip(with_attachments, sent):
+            results[i] = result
+
+        return results
+
+
+class LocalTransport:
+    """Transport that keeps messages in memory, for development and tests."""
+
+    def __init__(self):
+        self.outbox: list[dict] = []
+
+    async def send(self, message: dict) -> str | None:
+        """Record a message instead of sending it."""
+        self.outbox.append(message)
+        logger.info(f"Local transport captured email to {message['to']}")
+        return f"local-{len(self.outbox)}"
+
+    async def send_batch(self, messages: list[dict]) -> list[str | None | Exception]:
+        """Record several messages instead of sending them."""
+        return [await self.send(message) for message in messages]
+
+
+def create_transport(name: str) -> EmailTransport:
+    """Create an email transport by name."""
+    if name == "resend":
+        return ResendTransport(outbound_http)
+    if name == "local":
+        return LocalTransport()
+    raise ValueError(f"Unknown email transport: {name}")
+
+
+email_transport: EmailTransport = create_transport(settings.EMAIL_TRANSPORT)
+
+
+def get_email_transport() -> EmailTransport:
+    """Get the active email transport."""
+    return email_transport
+
+
+def set_email_transport(transport: EmailTransport) -> None:
+    """Replace the active email transport."""
+    global email_transport
+    email_transport = transport
+
+
+def build_invoice_email(
+    invoice: Invoice,
+    client: Client,
+    company_name: str,
+    pdf_content: bytes | None = None,
+) -> dict:
+    """Build the invoice email message with optional PDF attachment."""
+    template = jinja_env.get_template("invoice.html")
+    html_content = template.render(
+        invoice_number=invoice.invoice_number,
+        client_name=client.name,
+        company_name=company_name,
+        issue_date=invoice.issue_date.strftime("%B %d, %Y"),
+        due_date=invoice.due_date.strftime("%B %d, %Y"),
+        currency=invoice.currency.value,
+        subtotal=f"{invoice.subtotal:.2f}",
+        tax_total=f"{invoice.tax_total:.2f}" if invoice.tax_total else None,
+        amount=f"{invoice.amount:.2f}",
+        payment_terms=invoice.payment_terms,
+    )
+
+    message = {
+        "from": f"{settings.EMAILS_FROM_NAME} <{settings.EMAILS_FROM_EMAIL}>",
+        "to": [client.email],
+        "subject": f"Invoice {invoice.invoice_number}",
+        "html": html_content,
+    }
+
+    if pdf_content:
+        message["attachments"] = [
+            {
+                "filename": f"invoice_{invoice.invoice_number}.pdf",
+                "content": base64.b64encode(pdf_content).decode('utf-8'),
+            }
+        ]
+
+    return message
+
+
 async def send_invoice_email(
     invoice: Invoice,
     client: Client,
@@ -25,34 +167,8 @@ async def send_invoice_email(
 ) -> bool:
     """Send invoice via email with optional PDF attachment."""
     try:
-        template = jinja_env.get_template("invoice.html")
-        html_content = template.render(
-            invoice_number=invoice.invoice_number,
-            client_name=client.name,
-            company_name=company_name,
-            issue_date=invoice.issue_date.strftime("%B %d, %Y"),
-            due_date=invoice.due_date.strftime("%B %d, %Y"),
-            currency=invoice.currency.value,
-            amount=f"{invoice.amount:.2f}",
-            payment_terms=invoice.payment_terms,
-        )
-        
-        params = {
-            "from": f"{settings.EMAILS_FROM_NAME} <{settings.EMAILS_FROM_EMAIL}>",
-            "to": [client.email],
-            "subject": f"Invoice {invoice.invoice_number}",
-            "html": html_content,
-        }
-        
-        if pdf_content:
-            params["attachments"] = [
-                {
-                    "filename": f"invoice_{invoice.invoice_number}.pdf",
-                    "content": base64.b64encode(pdf_content).decode('utf-8'),
-                }
-            ]
-        
-        resend.Emails.send(params)
+        message = build_invoice_email(invoice, client, company_name, pdf_content)
+        await get_email_transport().send(message)
         logger.info(f"Invoice email sent to {client.email}")
         return True
     except Exception as e:
@@ -0,0 +1,258 @@
+"""Outbound email queue service."""
+
+import asyncio
+import uuid
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import and_, insert, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
+
+from app.core.config import settings
+from app.core.constants import EmailJobStatus, InvoiceStatus
+from app.core.database import AsyncSessionLocal
+from app.core.exceptions import BadRequestException, ForbiddenException, NotFoundException
+from app.core.logging import logger
+from app.core.tasks import PeriodicTask
+from app.models.email_job import EmailJob
+from app.models.invoice import Invoice
+from app.models.user import User
+from app.services.auth import get_user_profile
+from app.services.email import build_invoice_email, get_email_transport
+from app.services.invoice import invoice_filters
+from app.services.pdf import render_invoice_pdf
+
+
+async def enqueue_invoice_email(db: AsyncSession, user_id: int, invoice_id: int) -> EmailJob:
+    """Queue an invoice email for background delivery."""
+    invoice_exists = await db.scalar(
+        select(Invoice.id).where(Invoice.id == invoice_id, Invoice.user_id == user_id)
+    )
+    if invoice_exists is None:
+        raise NotFoundException("Invoice not found")
+    
+    job = EmailJob(
+        user_id=user_id,
+        invoice_id=invoice_id,
+        status=EmailJobStatus.PENDING,
+        attempts=0,
+        max_attempts=settings.EMAIL_MAX_ATTEMPTS,
+        next_attempt_at=datetime.utcnow(),
+    )
+    db.add(job)
+    await db.flush()
+    await db.refresh(job)
+    return job
+
+
+async def get_email_job(db: AsyncSession, user_id: int, job_id: int) -> EmailJob:
+    """Get an email job by ID."""
+    job = await db.get(EmailJob, job_id)
+    
+    if not job:
+        raise NotFoundException("Email job not found")
+    
+    if job.user_id != user_id:
+        raise ForbiddenException("Access denied")
+    
+    return job
+
+
+def retry_delay(attempts: int) -> timedelta:
+    """Exponential backoff delay after a failed attempt."""
+    seconds = settings.EMAIL_RETRY_BASE_SECONDS * 2 ** max(attempts - 1, 0)
+    return timedelta(seconds=min(seconds, settings.EMAIL_RETRY_MAX_SECONDS))
+
+
+async def claim_email_jobs(db: AsyncSession, limit: int) -> list[EmailJob]:
+    """Lock due jobs and mark them as sending.
+
+    Jobs left in ``sending`` past the lease (worker crashed mid-delivery)
+    are reclaimed. ``SKIP LOCKED`` lets several workers poll concurrently.
+    """
+    now = datetime.utcnow()
+    lease_expired = now - timedelta(seconds=settings.EMAIL_JOB_LEASE_SECONDS)
+    
+    result = await db.execute(
+        select(EmailJob)
+        .where(
+            or_(
+                and_(EmailJob.status == EmailJobStatus.PENDING, EmailJob.next_attempt_at <= now),
+                and_(EmailJob.status == EmailJobStatus.SENDING, EmailJob.updated_at < lease_expired),
+            )
+        )
+        .order_by(EmailJob.next_attempt_at)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    jobs = list(result.scalars().all())
+    
+    for job in jobs:
+        job.status = EmailJobStatus.SENDING
+        job.updated_at = now
+    
+    await db.flush()
+    return jobs
+
+
+def record_failure(job: EmailJob, error: str) -> None:
+    """Schedule a retry, or dead-letter the job once attempts run out."""
+    job.last_error = error
+    
+    if job.attempts >= job.max_attempts:
+        job.status = EmailJobStatus.DEAD
+        logger.error(f"Email job {job.id} dead after {job.attempts} attempts: {error}")
+        return
+    
+    job.status = EmailJobStatus.PENDING
+    job.next_attempt_at = datetime.utcnow() + retry_delay(job.attempts)
+    logger.warning(f"Email job {job.id} attempt {job.attempts} failed, retrying: {error}")
+
+
+async def load_job_invoices(db: AsyncSession, jobs: list[EmailJob]) -> dict[int, Invoice]:
+    """Load the invoices of claimed jobs with line items and client in one pass."""
+    result = await db.execute(
+        select(Invoice)
+        .options(selectinload(Invoice.line_items), joinedload(Invoice.client))
+        .where(Invoice.id.in_({job.invoice_id for job in jobs}))
+    )
+    return {invoice.id: invoice for invoice in result.scalars().unique().all()}
+
+
+async def process_email_job_batch() -> int:
+    """Claim a batch of due jobs, render their PDFs concurrently and send them together."""
+    async with AsyncSessionLocal() as db:
+        jobs = await claim_email_jobs(db, settings.EMAIL_WORKER_BATCH_SIZE)
+        await db.commit()
+        if not jobs:
+            return 0
+        
+        invoices = await load_job_invoices(db, jobs)
+        # Loaded up front: the renders below run concurrently and cannot share the session.
+        users: dict[int, User] = {
+            user_id: await get_user_profile(db, user_id) for user_id in {job.user_id for job in jobs}
+        }
+        render_slots = asyncio.Semaphore(settings.EMAIL_WORKER_CONCURRENCY)
+        
+        async def prepare(job: EmailJob) -> dict:
+            invoice = invoices.get(job.invoice_id)
+            if invoice is None or invoice.user_id != job.user_id:
+                raise NotFoundException("Invoice not found")
+            user = users[job.user_id]
+            async with render_slots:
+                pdf_bytes = await render_invoice_pdf(invoice, invoice.client, user, invoice.template_name)
+            return build_invoice_email(invoice, invoice.client, user.company_name or user.username, pdf_bytes)
+        
+        prepared = await asyncio.gather(*(prepare(job) for job in jobs), return_exceptions=True)
+        
+        ready = []
+        for job, message in zip(jobs, prepared):
+            job.attempts += 1
+            if isinstance(message, Exception):
+                record_failure(job, str(message))
+            else:
+                ready.append((job, message))
+        
+        if ready:
+            try:
+                results = await get_email_transport().send_batch([message for _, message in ready])
+            except Exception as e:
+                # The whole batch failed (network error, open circuit): retry every job
+                # with backoff instead of leaving them in sending until the lease runs out.
+                results = [e] * len(ready)
+            for (job, message), result in zip(ready, results):
+                if isinstance(result, Exception):
+                    record_failure(job, str(result))
+                    continue
+                job.provider_message_id = result
+                job.status = EmailJobStatus.SENT
+                job.sent_at = datetime.utcnow()
+                job.last_error = None
+                logger.info(f"Invoice email sent to {message['to'][0]} (job {job.id})")
+        
+        await db.commit()
+        return len(jobs)
+
+
+async def process_email_jobs() -> int:
+    """Deliver due jobs batch by batch until the queue is drained."""
+    processed = 0
+    while True:
+        count = await process_email_job_batch()
+        processed += count
+        if count < settings.EMAIL_WORKER_BATCH_SIZE:
+            return processed
+
+
+async def enqueue_invoice_email_batch(
+    db: AsyncSession,
+    user_id: int,
+    invoice_ids: list[int] | None = None,
+    status: InvoiceStatus | None = None,
+    client_id: int | None = None,
+    start_date: date | None = None,
+    end_date: date | None = None,
+) -> tuple[str, list[int], list[int]]:
+    """Queue emails for many invoices, selected by ID or by listing filters.
+
+    Returns the batch ID, the queued invoice IDs and the requested IDs that
+    were not found for this user.
+    """
+    conditions = invoice_filters(user_id, status, client_id, start_date, end_date)
+    if invoice_ids is not None:
+        conditions.append(Invoice.id.in_(invoice_ids))
+    
+    result = await db.execute(
+        select(Invoice.id)
+        .where(*conditions)
+        .order_by(Invoice.id)
+        .limit(settings.EMAIL_BATCH_MAX_INVOICES + 1)
+    )
+    found_ids = list(result.scalars().all())
+    if len(found_ids) > settings.EMAIL_BATCH_MAX_INVOICES:
+        raise BadRequestException(
+            f"A batch can send at most {settings.EMAIL_BATCH_MAX_INVOICES} invoices"
+        )
+    
+    missing_ids = sorted(set(invoice_ids) - set(found_ids)) if invoice_ids is not None else []
+    batch_id = uuid.uuid4().hex
+    
+    if found_ids:
+        now = datetime.utcnow()
+        await db.execute(
+            insert(EmailJob),
+            [
+                {
+                    "user_id": user_id,
+                    "invoice_id": invoice_id,
+                    "batch_id": batch_id,
+                    "status": EmailJobStatus.PENDING,
+                    "attempts": 0,
+                    "max_attempts": settings.EMAIL_MAX_ATTEMPTS,
+                    "next_attempt_at": now,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for invoice_id in found_ids
+            ],
+        )
+    
+    return batch_id, found_ids, missing_ids
+
+
+async def get_email_batch(db: AsyncSession, user_id: int, batch_id: str) -> list[EmailJob]:
+    """Get the jobs of an email batch."""
+    result = await db.execute(
+        select(EmailJob)
+        .where(EmailJob.batch_id == batch_id, EmailJob.user_id == user_id)
+        .order_by(EmailJob.id)
+    )
+    jobs = list(result.scalars().all())
+    
+    if not jobs:
+        raise NotFoundException("Email batch not found")
+    
+    return jobs
+
+
+email_worker = PeriodicTask("email-worker", settings.EMAIL_WORKER_POLL_SECONDS, process_email_jobs)
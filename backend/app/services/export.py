@@ -0,0 +1,194 @@
+"""Bulk invoice export service."""
+
+import asyncio
+import csv
+import io
+import json
+import zipfile
+from collections.abc import AsyncIterator
+from datetime import date
+from decimal import Decimal
+from enum import Enum
+
+from sqlalchemy import select
+
+from app.core.config import settings
+from app.core.constants import InvoiceStatus
+from app.core.database import ReadSessionLocal
+from app.core.logging import logger
+from app.models.client import Client
+from app.models.invoice import Invoice
+from app.models.line_item import LineItem
+from app.models.user import User
+from app.services.invoice import invoice_filters, iter_invoice_batches
+from app.services.pdf import render_invoice_pdf
+
+INVOICE_EXPORT_COLUMNS = [
+    Invoice.id,
+    Invoice.invoice_number,
+    Invoice.status,
+    Invoice.currency,
+    Invoice.subtotal,
+    Invoice.tax_total,
+    Invoice.amount,
+    Invoice.issue_date,
+    Invoice.due_date,
+    Invoice.client_id,
+    Client.name.label("client_name"),
+    Invoice.template_name,
+    Invoice.payment_terms,
+    Invoice.notes,
+    Invoice.created_at,
+    Invoice.updated_at,
+]
+LINE_ITEM_EXPORT_COLUMNS = [
+    LineItem.id.label("line_item_id"),
+    LineItem.description,
+    LineItem.quantity,
+    LineItem.unit_price,
+    LineItem.tax_rate,
+    LineItem.subtotal.label("line_item_subtotal"),
+    LineItem.tax_amount.label("line_item_tax_amount"),
+    LineItem.total.label("line_item_total"),
+]
+
+
+class ZipChunkBuffer(io.RawIOBase):
+    """Write-only, non-seekable sink that hands ZIP output back in chunks.
+
+    ``zipfile`` falls back to streaming mode (data descriptors after each
+    entry) when the target cannot seek, so nothing needs to be buffered
+    beyond the entry currently being written.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._chunks: list[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        """Return and forget everything written so far."""
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+async def stream_invoice_pdf_zip(
+    user: User,
+    status: InvoiceStatus | None = None,
+    client_id: int | None = None,
+    start_date: date | None = None,
+    end_date: date | None = None,
+) -> AsyncIterator[bytes]:
+    """Stream a ZIP archive of invoice PDFs matching the filters."""
+    buffer = ZipChunkBuffer()
+    render_slots = asyncio.Semaphore(settings.PDF_RENDER_WORKERS)
+    exported = 0
+
+    async def render(invoice):
+        async with render_slots:
+            return await render_invoice_pdf(invoice, invoice.client, user, invoice.template_name)
+
+    async with ReadSessionLocal() as session:
+        with zipfile.ZipFile(buffer, mode="w", compression=zipfile.ZIP_STORED) as archive:
+            async for invoices in iter_invoice_batches(
+                session,
+                user.id,
+                settings.EXPORT_BATCH_SIZE,
+                status,
+                client_id,
+                start_date,
+                end_date,
+            ):
+                pdfs = await asyncio.gather(*(render(invoice) for invoice in invoices))
+                for invoice, pdf_bytes in zip(invoices, pdfs):
+                    archive.writestr(f"invoice_{invoice.invoice_number}.pdf", pdf_bytes)
+                    yield buffer.drain()
+                exported += len(invoices)
+
+        yield buffer.drain()
+
+    logger.info(f"Exported {exported} invoice PDFs for user {user.id}")
+
+
+def export_value(value):
+    """Convert a column value to a plain CSV/JSON value."""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, date):
+        return value.isoformat()
+    return value
+
+
+# Leading characters that make spreadsheet apps evaluate a cell as a formula.
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def csv_value(value):
+    """Convert a column value to a CSV cell, quoting user text that would run as a formula."""
+    if isinstance(value, str) and not isinstance(value, Enum) and value.startswith(FORMULA_PREFIXES):
+        return "'" + value
+    return export_value(value)
+
+
+def encode_csv_rows(rows: list[list]) -> str:
+    """Encode rows as CSV text."""
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    return buffer.getvalue()
+
+
+async def stream_invoice_rows(
+    user_id: int,
+    export_format: str,
+    include_line_items: bool = False,
+    status: InvoiceStatus | None = None,
+    client_id: int | None = None,
+    start_date: date | None = None,
+    end_date: date | None = None,
+) -> AsyncIterator[str]:
+    """Stream invoices matching the filters as CSV or JSON Lines.
+
+    Rows are read through a server-side cursor and written out one chunk at
+    a time, so memory use does not grow with the number of invoices. With
+    ``include_line_items`` there is one row per line item, with the invoice
+    columns repeated.
+    """
+    columns = INVOICE_EXPORT_COLUMNS + (LINE_ITEM_EXPORT_COLUMNS if include_line_items else [])
+    query = (
+        select(*columns)
+        .join(Client, Client.id == Invoice.client_id)
+        .where(*invoice_filters(user_id, status, client_id, start_date, end_date))
+    )
+    if include_line_items:
+        query = query.outerjoin(LineItem, LineItem.invoice_id == Invoice.id).order_by(Invoice.id, LineItem.id)
+    else:
+        query = query.order_by(Invoice.id)
+
+    chunk_size = settings.EXPORT_STREAM_CHUNK_ROWS
+    exported = 0
+
+    async with ReadSessionLocal() as session:
+        result = await session.stream(query.execution_options(yield_per=chunk_size))
+        names = list(result.keys())
+
+        if export_format == "csv":
+            yield encode_csv_rows([names])
+
+        async for partition in result.partitions():
+            if export_format == "csv":
+                yield encode_csv_rows([[csv_value(value) for value in row] for row in partition])
+            else:
+                rows = [[export_value(value) for value in row] for row in partition]
+                yield "".join(json.dumps(dict(zip(names, row))) + "\n" for row in rows)
+            exported += len(partition)
+
+    logger.info(f"Exported {exported} invoice rows as {export_format} for user {user_id}")
@@ -1,47 +1,95 @@
 """Invoice service."""
 
+from collections.abc import AsyncIterator
 from datetime import date, datetime
-from decimal import Decimal
+from decimal import ROUND_HALF_UP, Decimal
 
 from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import contains_eager, joinedload, selectinload
 
 from app.core.constants import InvoiceStatus
-from app.core.exceptions import ForbiddenException, NotFoundException
+from app.core.exceptions import BadRequestException, ForbiddenException, NotFoundException
 from app.models.invoice import Invoice
+from app.models.invoice_counter import InvoiceCounter
 from app.models.line_item import LineItem
-from app.schemas.invoice import InvoiceCreate, InvoiceUpdate
-from app.utils.pagination import PaginationParams
+from app.schemas.invoice import InvoiceCreate, InvoiceUpdate, LineItemCreate, LineItemUpdate
+from app.services.client import get_client_by_id
+from app.services.pdf_cache import pdf_cache
+from app.services.report import apply_aggregate_changes, invoice_aggregate_entry
+from app.utils.pagination import PaginationParams, apply_pagination, split_page
 
 
-async def generate_invoice_number(db: AsyncSession, user_id: int) -> str:
-    """Generate unique invoice number."""
+def format_invoice_number(year: int, sequence: int) -> str:
+    """Format an invoice number."""
+    return f"INV-{year}-{sequence:05d}"
+
+
+async def allocate_invoice_numbers(db: AsyncSession, user_id: int, count: int = 1) -> list[str]:
+    """Reserve a block of consecutive invoice numbers for a user.
+
+    The per-user, per-year counter row is bumped with a single upsert, so
+    allocation is constant-time and concurrent callers are serialized on
+    the row lock instead of racing to the same number.
+    """
     year = datetime.utcnow().year
-    result = await db.execute(
-        select(func.count()).select_from(Invoice).where(Invoice.user_id == user_id)
+    stmt = (
+        pg_insert(InvoiceCounter)
+        .values(user_id=user_id, year=year, last_value=count)
+        .on_conflict_do_update(
+            index_elements=[InvoiceCounter.user_id, InvoiceCounter.year],
+            set_={"last_value": InvoiceCounter.last_value + count},
+        )
+        .returning(InvoiceCounter.last_value)
     )
-    count = result.scalar() or 0
-    return f"INV-{year}-{count + 1:05d}"
+    last_value = await db.scalar(stmt)
+    return [format_invoice_number(year, n) for n in range(last_value - count + 1, last_value + 1)]
+
+
+async def generate_invoice_number(db: AsyncSession, user_id: int) -> str:
+    """Generate unique invoice number."""
+    numbers = await allocate_invoice_numbers(db, user_id)
+    return numbers[0]
 
 
-def calculate_invoice_amount(line_items: list[LineItem]) -> Decimal:
-    """Calculate total invoice amount including tax."""
-    total = Decimal("0")
-    for item in line_items:
-        subtotal = item.quantity * item.unit_price
-        tax = subtotal * (item.tax_rate / Decimal("100"))
-        total += subtotal + tax
-    return total
+CENT = Decimal("0.01")
+
+
+def calculate_line_item_amounts(item: LineItemCreate) -> dict[str, Decimal]:
+    """Calculate a line item's subtotal, tax and total, rounded to cents."""
+    subtotal = (item.quantity * item.unit_price).quantize(CENT, ROUND_HALF_UP)
+    tax_amount = (subtotal * item.tax_rate / Decimal("100")).quantize(CENT, ROUND_HALF_UP)
+    return {"subtotal": subtotal, "tax_amount": tax_amount, "total": subtotal + tax_amount}
+
+
+def build_line_item_values(items: list[LineItemCreate]) -> list[dict]:
+    """Get line item column values, including their computed amounts."""
+    return [{**item.model_dump(), **calculate_line_item_amounts(item)} for item in items]
+
+
+def calculate_invoice_totals(line_item_values: list[dict]) -> dict[str, Decimal]:
+    """Sum line item amounts into the invoice subtotal, tax total and amount."""
+    return {
+        "subtotal": sum((item["subtotal"] for item in line_item_values), Decimal("0")),
+        "tax_total": sum((item["tax_amount"] for item in line_item_values), Decimal("0")),
+        "amount": sum((item["total"] for item in line_item_values), Decimal("0")),
+    }
 
 
 async def create_invoice(db: AsyncSession, user_id: int, data: InvoiceCreate) -> Invoice:
-    """Create a new invoice."""
+    """Create a new invoice.
+
+    The invoice and its line items are written in a single flush and every
+    column value is known up front, so nothing has to be read back.
+    """
+    client = await get_client_by_id(db, user_id, data.client_id)
     invoice_number = await generate_invoice_number(db, user_id)
+    line_item_values = build_line_item_values(data.line_items)
     
     invoice = Invoice(
         user_id=user_id,
-        client_id=data.client_id,
+        client=client,
         invoice_number=invoice_number,
         issue_date=data.issue_date,
         due_date=data.due_date,
@@ -50,71 +98,113 @@ async def create_invoice(db: AsyncSession, user_id: int, data: InvoiceCreate) ->
         payment_terms=data.payment_terms,
         notes=data.notes,
         status=InvoiceStatus.DRAFT,
+        line_items=[LineItem(**values) for values in line_item_values],
+        **calculate_invoice_totals(line_item_values),
     )
     db.add(invoice)
     await db.flush()
-    
-    line_items = [
-        LineItem(invoice_id=invoice.id, **item.model_dump())
-        for item in data.line_items
-    ]
-    db.add_all(line_items)
-    await db.flush()
-    
-    invoice.amount = calculate_invoice_amount(line_items)
-    await db.flush()
-    await db.refresh(invoice, ["line_items", "client"])
+    await apply_aggregate_changes(db, added=[invoice_aggregate_entry(invoice)])
     
     return invoice
 
 
-async def get_invoices(
-    db: AsyncSession,
+def invoice_filters(
     user_id: int,
-    pagination: PaginationParams,
     status: InvoiceStatus | None = None,
     client_id: int | None = None,
     start_date: date | None = None,
     end_date: date | None = None,
-) -> tuple[list[Invoice], int]:
-    """Get paginated list of invoices for a user."""
-    query = select(Invoice).options(selectinload(Invoice.client)).where(Invoice.user_id == user_id)
-    count_query = select(func.count()).select_from(Invoice).where(Invoice.user_id == user_id)
-    count_query = select(func.count()).select_from(Invoice).where(Invoice.user_id == user_id)
+) -> list:
+    """Build WHERE conditions for invoice listing filters."""
+    conditions = [Invoice.user_id == user_id]
     
     if status:
-        query = query.where(Invoice.status == status)
-        count_query = count_query.where(Invoice.status == status)
+        conditions.append(Invoice.status == status)
     
     if client_id:
-        query = query.where(Invoice.client_id == client_id)
-        count_query = count_query.where(Invoice.client_id == client_id)
+        conditions.append(Invoice.client_id == client_id)
     
     if start_date:
-        query = query.where(Invoice.issue_date >= start_date)
-        count_query = count_query.where(Invoice.issue_date >= start_date)
+        conditions.append(Invoice.issue_date >= start_date)
     
     if end_date:
-        query = query.where(Invoice.issue_date <= end_date)
-        count_query = count_query.where(Invoice.issue_date <= end_date)
+        conditions.append(Invoice.issue_date <= end_date)
+    
+    return conditions
+
+
+async def get_invoices(
+    db: AsyncSession,
+    user_id: int,
+    pagination: PaginationParams,
+    status: InvoiceStatus | None = None,
+    client_id: int | None = None,
+    start_date: date | None = None,
+    end_date: date | None = None,
+) -> tuple[list[Invoice], int | None, str | None]:
+    """Get paginated list of invoices for a user."""
+    conditions = invoice_filters(user_id, status, client_id, start_date, end_date)
+    query = select(Invoice).options(selectinload(Invoice.client)).where(*conditions)
     
-    total = await db.scalar(count_query)
+    total = None
+    if pagination.include_total:
+        count_query = select(func.count()).select_from(Invoice).where(*conditions)
+        total = await db.scalar(count_query) or 0
     
-    result = await db.execute(
-        query.offset(pagination.offset).limit(pagination.limit).order_by(Invoice.created_at.desc())
-    )
-    invoices = result.scalars().all()
+    result = await db.execute(apply_pagination(query, pagination, Invoice.created_at, Invoice.id))
+    invoices, next_cursor = split_page(result.scalars().all(), pagination)
     
-    return list(invoices), total or 0
+    return invoices, total, next_cursor
 
 
-async def get_invoice_by_id(db: AsyncSession, user_id: int, invoice_id: int) -> Invoice:
-    """Get an invoice by ID with line items."""
-    result = await db.execute(
+async def iter_invoice_batches(
+    db: AsyncSession,
+    user_id: int,
+    batch_size: int,
+    status: InvoiceStatus | None = None,
+    client_id: int | None = None,
+    start_date: date | None = None,
+    end_date: date | None = None,
+) -> AsyncIterator[list[Invoice]]:
+    """Yield filtered invoices in id order, with line items and client loaded, one batch at a time."""
+    conditions = invoice_filters(user_id, status, client_id, start_date, end_date)
+    last_id = 0
+    
+    while True:
+        result = await db.execute(
+            select(Invoice)
+            .options(selectinload(Invoice.line_items), joinedload(Invoice.client))
+            .where(*conditions, Invoice.id > last_id)
+            .order_by(Invoice.id)
+            .limit(batch_size)
+        )
+        invoices = list(result.scalars().all())
+        if not invoices:
+            return
+        
+        yield invoices
+        last_id = invoices[-1].id
+        db.expunge_all()
+
+
+async def get_invoice_by_id(
+    db: AsyncSession, user_id: int, invoice_id: int, for_update: bool = False
+) -> Invoice:
+    """Get an invoice by ID with line items.
+
+    With ``for_update`` the invoice row is locked until the transaction ends
+    and re-read even if already loaded, so callers that derive aggregate
+    deltas from its current values cannot race a concurrent change.
+    """
+    query = (
         select(Invoice)
         .options(selectinload(Invoice.line_items), selectinload(Invoice.client))
         .where(Invoice.id == invoice_id)
     )
+    if for_update:
+        query = query.with_for_update().execution_options(populate_existing=True)
+    
+    result = await db.execute(query)
     invoice = result.scalar_one_or_none()
     
     if not invoice:
@@ -126,86 +216,143 @@ async def get_invoice_by_id(db: AsyncSession, user_id: int, invoice_id: int) ->
     return invoice
 
 
+async def get_invoice_detail(db: AsyncSession, user_id: int, invoice_id: int) -> Invoice:
+    """Get an invoice with line items and client in a single query."""
+    result = await db.execute(
+        select(Invoice)
+        .join(Invoice.client)
+        .options(
+            contains_eager(Invoice.client),
+            joinedload(Invoice.line_items),
+        )
+        .where(Invoice.id == invoice_id, Invoice.user_id == user_id)
+    )
+    invoice = result.unique().scalar_one_or_none()
+    
+    if not invoice:
+        raise NotFoundException("Invoice not found")
+    
+    return invoice
+
+
+def sync_line_items(invoice: Invoice, items: list[LineItemUpdate]) -> None:
+    """Apply submitted line items to an invoice as a diff against its stored ones.
+
+    Items without an id are added, items with one update the matching line
+    item only if a value changed, and stored items left out are removed.
+    The unit of work then writes each kind of change as one batched
+    statement, so untouched rows cost nothing.
+    """
+    existing = {item.id: item for item in invoice.line_items}
+    submitted_ids = [item.id for item in items if item.id is not None]
+    
+    if len(submitted_ids) != len(set(submitted_ids)):
+        raise BadRequestException("Duplicate line item id")
+    
+    unknown_ids = set(submitted_ids) - existing.keys()
+    if unknown_ids:
+        raise BadRequestException(f"Line items not found on this invoice: {sorted(unknown_ids)}")
+    
+    for item_id in existing.keys() - set(submitted_ids):
+        invoice.line_items.remove(existing[item_id])
+    
+    line_item_values = build_line_item_values(items)
+    for values in line_item_values:
+        item_id = values.pop("id")
+        if item_id is None:
+            invoice.line_items.append(LineItem(**values))
+            continue
+        
+        line_item = existing[item_id]
+        for field, value in values.items():
+            if getattr(line_item, field) != value:
+                setattr(line_item, field, value)
+    
+    for field, value in calculate_invoice_totals(line_item_values).items():
+        setattr(invoice, field, value)
+
+
 async def update_invoice(db: AsyncSession, user_id: int, invoice_id: int, data: InvoiceUpdate) -> Invoice:
     """Update an invoice."""
-    invoice = await get_invoice_by_id(db, user_id, invoice_id)
+    invoice = await get_invoice_by_id(db, user_id, invoice_id, for_update=True)
+    before = invoice_aggregate_entry(invoice)
+    client_id = invoice.client_id
     
-    update_data = data.model_dump(exclude_unset=True, exclude={"line_items"})
+    update_data = data.model_dump(exclude_unset=True, exclude={"line_items", "client_id"})
     for field, value in update_data.items():
         setattr(invoice, field, value)
     
+    if data.client_id is not None and data.client_id != invoice.client_id:
+        invoice.client = await get_client_by_id(db, user_id, data.client_id)
+    
     if data.line_items is not None:
-        await db.execute(select(LineItem).where(LineItem.invoice_id == invoice_id))
-        for item in invoice.line_items:
-            await db.delete(item)
-        
-        line_items = [
-            LineItem(invoice_id=invoice.id, **item.model_dump())
-            for item in data.line_items
-        ]
-        db.add_all(line_items)
-        await db.flush()
-        await db.refresh(invoice, ["line_items"])
-        
-        invoice.amount = calculate_invoice_amount(invoice.line_items)
+        sync_line_items(invoice, data.line_items)
     
     await db.flush()
-    await db.refresh(invoice)
+    await apply_aggregate_changes(db, removed=[before], added=[invoice_aggregate_entry(invoice)])
+    pdf_cache.invalidate_invoice(user_id, client_id, invoice_id)
     return invoice
 
 
 async def delete_invoice(db: AsyncSession, user_id: int, invoice_id: int) -> None:
     """Delete an invoice."""
-    invoice = await get_invoice_by_id(db, user_id, invoice_id)
+    invoice = await get_invoice_by_id(db, user_id, invoice_id, for_update=True)
+    before = invoice_aggregate_entry(invoice)
     await db.delete(invoice)
     await db.flush()
+    await apply_aggregate_changes(db, removed=[before])
+    pdf_cache.invalidate_invoice(user_id, invoice.client_id, invoice_id)
 
 
 async def update_invoice_status(
     db: AsyncSession, user_id: int, invoice_id: int, status: InvoiceStatus
 ) -> Invoice:
     """Update invoice status."""
-    invoice = await get_invoice_by_id(db, user_id, invoice_id)
+    invoice = await get_invoice_by_id(db, user_id, invoice_id, for_update=True)
+    before = invoice_aggregate_entry(invoice)
     invoice.status = status
     await db.flush()
-    await db.refresh(invoice)
+    await apply_aggregate_changes(db, removed=[before], added=[invoice_aggregate_entry(invoice)])
+    pdf_cache.invalidate_invoice(user_id, invoice.client_id, invoice_id)
     return invoice
 
 
 async def clone_invoice(db: AsyncSession, user_id: int, invoice_id: int) -> Invoice:
     """Clone an existing invoice."""
-    original = await get_invoice_by_id(db, user_id, invoice_id)
+    original = await get_invoice_detail(db, user_id, invoice_id)
     
     invoice_number = await generate_invoice_number(db, user_id)
     
     new_invoice = Invoice(
         user_id=user_id,
-        client_id=original.client_id,
+        client=original.client,
         invoice_number=invoice_number,
         issue_date=date.today(),
         due_date=original.due_date,
         currency=original.currency,
+        template_name=original.template_name,
         payment_terms=original.payment_terms,
         notes=original.notes,
         status=InvoiceStatus.DRAFT,
+        subtotal=original.subtotal,
+        tax_total=original.tax_total,
         amount=original.amount,
+        line_items=[
+            LineItem(
+                description=item.description,
+                quantity=item.quantity,
+                unit_price=item.unit_price,
+                tax_rate=item.tax_rate,
+                subtotal=item.subtotal,
+                tax_amount=item.tax_amount,
+                total=item.total,
+            )
+            for item in original.line_items
+        ],
     )
     db.add(new_invoice)
     await db.flush()
-    
-    line_items = [
-        LineItem(
-            invoice_id=new_invoice.id,
-            description=item.description,
-            quantity=item.quantity,
-            unit_price=item.unit_price,
-            tax_rate=item.tax_rate,
-        )
-        for item in original.line_items
-    ]
-    db.add_all(line_items)
-    await db.flush()
-    await db.refresh(new_invoice, ["line_items"])
+    await apply_aggregate_changes(db, added=[invoice_aggregate_entry(new_invoice)])
     
     return new_invoice
 
@@ -0,0 +1,166 @@
+"""Bulk invoice import service."""
+
+import csv
+import io
+from datetime import datetime
+from typing import Any
+
+from pydantic import ValidationError
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.constants import InvoiceStatus
+from app.core.exceptions import BadRequestException
+from app.models.client import Client
+from app.models.invoice import Invoice
+from app.models.line_item import LineItem
+from app.schemas.invoice import BulkInvoiceCreated, BulkInvoiceError, InvoiceCreate
+from app.services.invoice import allocate_invoice_numbers, build_line_item_values, calculate_invoice_totals
+from app.services.report import aggregate_key, apply_aggregate_changes
+
+INVOICE_CSV_FIELDS = (
+    "client_id",
+    "issue_date",
+    "due_date",
+    "currency",
+    "template_name",
+    "payment_terms",
+    "notes",
+)
+LINE_ITEM_CSV_FIELDS = ("description", "quantity", "unit_price", "tax_rate")
+
+
+def parse_invoice_csv(content: str) -> list[tuple[int, dict[str, Any]]]:
+    """Parse an invoice CSV into (line number, invoice data) rows.
+
+    Each line holds one line item. Lines sharing a ``reference`` value are
+    grouped into one invoice whose fields are taken from its first line;
+    without a ``reference`` column every line is its own invoice.
+    """
+    reader = csv.DictReader(io.StringIO(content))
+    if not reader.fieldnames:
+        raise BadRequestException("CSV file is empty")
+
+    invoices: dict[str, tuple[int, dict[str, Any]]] = {}
+    for line_number, line in enumerate(reader, start=2):
+        line = {key: value for key, value in line.items() if key and value not in (None, "")}
+        reference = line.get("reference") or f"line-{line_number}"
+
+        if reference not in invoices:
+            data = {field: line[field] for field in INVOICE_CSV_FIELDS if field in line}
+            data["line_items"] = []
+            invoices[reference] = (line_number, data)
+
+        invoices[reference][1]["line_items"].append(
+            {field: line[field] for field in LINE_ITEM_CSV_FIELDS if field in line}
+        )
+
+    return list(invoices.values())
+
+
+def validation_errors(row: int, error: ValidationError) -> list[BulkInvoiceError]:
+    """Flatten a pydantic validation error into per-field row errors."""
+    return [
+        BulkInvoiceError(
+            row=row,
+            field=".".join(str(part) for part in detail["loc"]) or None,
+            message=detail["msg"],
+        )
+        for detail in error.errors()
+    ]
+
+
+async def bulk_create_invoices(
+    db: AsyncSession, user_id: int, rows: list[tuple[int, dict[str, Any]]]
+) -> tuple[list[BulkInvoiceCreated], list[BulkInvoiceError]]:
+    """Create many invoices with batched inserts.
+
+    Every row is validated with ``InvoiceCreate``; invalid rows and rows for
+    unknown clients are reported and skipped while the rest are created.
+    Invoice numbers are reserved in one step and invoices and line items
+    are written with multi-row inserts.
+    """
+    if len(rows) > settings.INVOICE_IMPORT_MAX_ROWS:
+        raise BadRequestException(f"An import can create at most {settings.INVOICE_IMPORT_MAX_ROWS} invoices")
+
+    errors: list[BulkInvoiceError] = []
+    valid: list[tuple[int, InvoiceCreate]] = []
+    for row, data in rows:
+        try:
+            valid.append((row, InvoiceCreate.model_validate(data)))
+        except ValidationError as e:
+            errors.extend(validation_errors(row, e))
+
+    client_ids = {invoice.client_id for _, invoice in valid}
+    owned_client_ids = set()
+    if client_ids:
+        result = await db.execute(
+            select(Client.id).where(Client.user_id == user_id, Client.id.in_(client_ids))
+        )
+        owned_client_ids = set(result.scalars().all())
+
+    accepted = []
+    for row, invoice in valid:
+        if invoice.client_id in owned_client_ids:
+            accepted.append((row, invoice))
+        else:
+            errors.append(BulkInvoiceError(row=row, field="client_id", message="Client not found"))
+
+    errors.sort(key=lambda error: error.row)
+    if not accepted:
+        return [], errors
+
+    invoice_numbers = await allocate_invoice_numbers(db, user_id, len(accepted))
+    line_item_values = [build_line_item_values(invoice.line_items) for _, invoice in accepted]
+    totals = [calculate_invoice_totals(values) for values in line_item_values]
+    now = datetime.utcnow()
+
+    result = await db.execute(
+        insert(Invoice).returning(Invoice.id, sort_by_parameter_order=True),
+        [
+            {
+                "user_id": user_id,
+                "client_id": invoice.client_id,
+                "invoice_number": invoice_number,
+                "status": InvoiceStatus.DRAFT,
+                "currency": invoice.currency,
+                **invoice_totals,
+                "template_name": invoice.template_name,
+                "issue_date": invoice.issue_date,
+                "due_date": invoice.due_date,
+                "payment_terms": invoice.payment_terms,
+                "notes": invoice.notes,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for (_, invoice), invoice_number, invoice_totals in zip(accepted, invoice_numbers, totals)
+        ],
+    )
+    invoice_ids = list(result.scalars().all())
+
+    await db.execute(
+        insert(LineItem),
+        [
+            {"invoice_id": invoice_id, **values}
+            for invoice_values, invoice_id in zip(line_item_values, invoice_ids)
+            for values in invoice_values
+        ],
+    )
+
+    await apply_aggregate_changes(
+        db,
+        added=[
+            (
+                aggregate_key(user_id, invoice.client_id, InvoiceStatus.DRAFT, invoice.currency, invoice.issue_date),
+                invoice_totals["amount"],
+            )
+            for (_, invoice), invoice_totals in zip(accepted, totals)
+        ],
+    )
+
+    created = [
+        BulkInvoiceCreated(row=row, id=invoice_id, invoice_number=invoice_number)
+        for (row, _), invoice_id, invoice_number in zip(accepted, invoice_ids, invoice_numbers)
+    ]
+    return created, errors
@@ -0,0 +1,71 @@
+"""Overdue invoice sweeper."""
+
+from datetime import date
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.constants import InvoiceStatus
+from app.core.database import AsyncSessionLocal
+from app.core.logging import logger
+from app.core.tasks import PeriodicTask
+from app.models.invoice import Invoice
+from app.services.report import aggregate_key, apply_aggregate_changes
+
+
+async def mark_overdue_invoice_batch(db: AsyncSession, today: date, batch_size: int) -> int:
+    """Mark up to ``batch_size`` sent invoices past their due date as overdue.
+
+    A single UPDATE does the work; rows locked by concurrent writers are
+    skipped and picked up by a later sweep. The status is checked again on
+    the locked rows, so the SENT to OVERDUE deltas below match what changed.
+    """
+    batch = (
+        select(Invoice.id)
+        .where(Invoice.status == InvoiceStatus.SENT, Invoice.due_date < today)
+        .order_by(Invoice.due_date)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    )
+    result = await db.execute(
+        update(Invoice)
+        .where(Invoice.id.in_(batch.scalar_subquery()), Invoice.status == InvoiceStatus.SENT)
+        .values(status=InvoiceStatus.OVERDUE)
+        .returning(Invoice.user_id, Invoice.client_id, Invoice.currency, Invoice.issue_date, Invoice.amount)
+        .execution_options(synchronize_session=False)
+    )
+    rows = result.all()
+
+    await apply_aggregate_changes(
+        db,
+        removed=[
+            (aggregate_key(row.user_id, row.client_id, InvoiceStatus.SENT, row.currency, row.issue_date), row.amount)
+            for row in rows
+        ],
+        added=[
+            (aggregate_key(row.user_id, row.client_id, InvoiceStatus.OVERDUE, row.currency, row.issue_date), row.amount)
+            for row in rows
+        ],
+    )
+    return len(rows)
+
+
+async def sweep_overdue_invoices() -> int:
+    """Mark every sent invoice past its due date as overdue, one committed batch at a time."""
+    today = date.today()
+    marked = 0
+    while True:
+        async with AsyncSessionLocal() as db:
+            count = await mark_overdue_invoice_batch(db, today, settings.OVERDUE_SWEEP_BATCH_SIZE)
+            await db.commit()
+        marked += count
+        if count < settings.OVERDUE_SWEEP_BATCH_SIZE:
+            break
+
+    if marked:
+        logger.info(f"Marked {marked} invoices as overdue")
+    return marked
+
+
+overdue_sweeper = PeriodicTask("overdue-sweeper", settings.OVERDUE_SWEEP_INTERVAL_SECONDS, sweep_overdue_invoices)
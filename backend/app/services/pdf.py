@@ -1,16 +1,27 @@
 """PDF generation service."""
 
+import hashlib
+import json
+import re
 from pathlib import Path
-from jinja2 import Environment, FileSystemLoader
-from weasyprint import HTML
+from jinja2 import Environment, FileSystemLoader, Template
+from weasyprint import CSS, HTML
+from weasyprint.text.fonts import FontConfiguration
 from decimal import Decimal
 
+from app.core.config import settings
+from app.core.exceptions import BadRequestException
+from app.core.executor import BoundedExecutor
 from app.models.client import Client
 from app.models.invoice import Invoice
 from app.models.user import User
+from app.services.pdf_cache import pdf_cache
 
 TEMPLATES_DIR = Path(__file__).parent.parent / "templates" / "invoice"
 
+# Bump when rendering logic changes so previously cached PDFs are not reused.
+RENDER_VERSION = 2
+
 
 def get_currency_symbol(currency: str) -> str:
     """Get currency symbol."""
@@ -28,6 +39,146 @@ def format_currency(amount: float | Decimal) -> str:
     return f"{float(amount):,.2f}"
 
 
+class InvoiceRenderer:
+    """Invoice renderer with templates, stylesheets and fonts prepared once per process.
+
+    Templates are compiled from their source with the ``<style>`` blocks
+    stripped out; the CSS is parsed once into a WeasyPrint stylesheet and
+    passed to every render together with a shared font configuration.
+    """
+
+    STYLE_PATTERN = re.compile(r"<style[^>]*>(.*?)</style>", re.DOTALL | re.IGNORECASE)
+
+    def __init__(self, templates_dir: Path):
+        self.templates_dir = templates_dir
+        self.env = Environment(loader=FileSystemLoader(templates_dir), auto_reload=False)
+        self.env.filters['format_currency'] = format_currency
+        self._templates: dict[str, Template] = {}
+        self._css_sources: dict[str, str] = {}
+        self._fingerprints: dict[str, str] = {}
+        self._stylesheets: dict[str, CSS] = {}
+        self._font_config: FontConfiguration | None = None
+
+    def _load(self, template_name: str) -> None:
+        path = (self.templates_dir / template_name).resolve()
+        if path.parent != self.templates_dir.resolve() or not path.is_file():
+            raise BadRequestException(f"Unknown invoice template: {template_name}")
+        
+        source = path.read_text(encoding="utf-8")
+        self._css_sources[template_name] = "\n".join(self.STYLE_PATTERN.findall(source))
+        self._templates[template_name] = self.env.from_string(self.STYLE_PATTERN.sub("", source))
+        self._fingerprints[template_name] = hashlib.sha256(source.encode()).hexdigest()
+
+    def load_templates(self) -> None:
+        """Compile every template in the templates directory."""
+        for path in sorted(self.templates_dir.glob("*.html")):
+            self._load(path.name)
+
+    def template(self, template_name: str) -> Template:
+        """Get a compiled template."""
+        if template_name not in self._templates:
+            self._load(template_name)
+        return self._templates[template_name]
+
+    def fingerprint(self, template_name: str) -> str:
+        """Get the content hash of a template."""
+        if template_name not in self._fingerprints:
+            self._load(template_name)
+        return self._fingerprints[template_name]
+
+    @property
+    def font_config(self) -> FontConfiguration:
+        """Get the shared font configuration."""
+        if self._font_config is None:
+            self._font_config = FontConfiguration()
+        return self._font_config
+
+    def stylesheet(self, template_name: str) -> CSS:
+        """Get the parsed stylesheet of a template."""
+        if template_name not in self._stylesheets:
+            if template_name not in self._css_sources:
+                self._load(template_name)
+            self._stylesheets[template_name] = CSS(
+                string=self._css_sources[template_name], font_config=self.font_config
+            )
+        return self._stylesheets[template_name]
+
+    def warm_up(self) -> None:
+        """Compile templates, parse stylesheets and resolve fonts ahead of the first render."""
+        self.load_templates()
+        for template_name in self._templates:
+            self.stylesheet(template_name)
+        HTML(string="<p>warm-up</p>").write_pdf(font_config=self.font_config)
+
+    def render_html(
+        self,
+        invoice: Invoice,
+        client: Client,
+        user: User,
+        template_name: str = "invoice_template.html"
+    ) -> str:
+        """Render invoice HTML without its stylesheet."""
+        template = self.template(template_name)
+        
+        currency_symbol = get_currency_symbol(invoice.currency.value)
+        
+        line_items = [
+            {
+                "description": item.description,
+                "quantity": float(item.quantity),
+                "unit_price": float(item.unit_price),
+                "tax_rate": float(item.tax_rate),
+                "total_price": float(item.total),
+            }
+            for item in invoice.line_items
+        ]
+        
+        return template.render(
+            invoice=invoice,
+            client=client,
+            user=user,
+            currency_symbol=currency_symbol,
+            line_items=line_items,
+            subtotal=float(invoice.subtotal),
+        )
+
+    def write_pdf(self, html_content: str, template_name: str) -> bytes:
+        """Convert rendered HTML to PDF bytes with the template's cached stylesheet."""
+        return HTML(string=html_content).write_pdf(
+            stylesheets=[self.stylesheet(template_name)],
+            font_config=self.font_config,
+        )
+
+
+renderer = InvoiceRenderer(TEMPLATES_DIR)
+
+
+def warm_up_worker() -> None:
+    """Prepare the renderer inside a rendering pool worker."""
+    renderer.warm_up()
+
+
+def html_to_pdf(html_content: str, template_name: str) -> bytes:
+    """Convert rendered HTML to PDF bytes."""
+    return renderer.write_pdf(html_content, template_name)
+
+
+pdf_executor = BoundedExecutor(
+    "PDF renderer",
+    max_workers=settings.PDF_RENDER_WORKERS,
+    max_pending=settings.PDF_RENDER_MAX_PENDING,
+    timeout=settings.PDF_RENDER_TIMEOUT_SECONDS,
+    use_processes=True,
+    initializer=warm_up_worker,
+)
+
+
+async def warm_up_pdf_renderer() -> None:
+    """Compile templates and start warmed-up rendering workers."""
+    renderer.load_templates()
+    await pdf_executor.warm_up()
+
+
 def generate_invoice_pdf(
     invoice: Invoice,
     client: Client,
@@ -35,40 +186,65 @@ def generate_invoice_pdf(
     template_name: str = "invoice_template.html"
 ) -> bytes:
     """Generate PDF from HTML template."""
-    env = Environment(loader=FileSystemLoader(TEMPLATES_DIR))
-    env.filters['format_currency'] = format_currency
-    
-    template = env.get_template(template_name)
-    
-    currency_symbol = get_currency_symbol(invoice.currency.value)
-    
-    # Calculate line item totals
-    line_items_with_totals = []
-    subtotal = Decimal("0")
-    
-    for item in invoice.line_items:
-        item_subtotal = item.quantity * item.unit_price
-        tax = item_subtotal * (item.tax_rate / Decimal("100"))
-        total_price = item_subtotal + tax
-        subtotal += total_price
-        
-        line_items_with_totals.append({
-            "description": item.description,
-            "quantity": float(item.quantity),
-            "unit_price": float(item.unit_price),
-            "tax_rate": float(item.tax_rate),
-            "total_price": float(total_price),
-        })
-    
-    html_content = template.render(
-        invoice=invoice,
-        client=client,
-        user=user,
-        currency_symbol=currency_symbol,
-        line_items=line_items_with_totals,
-        subtotal=float(subtotal),
-    )
+    html_content = renderer.render_html(invoice, client, user, template_name)
+    return renderer.write_pdf(html_content, template_name)
+
+
+def invoice_render_key(
+    invoice: Invoice,
+    client: Client,
+    user: User,
+    template_name: str = "invoice_template.html"
+) -> str:
+    """Hash every input that affects the rendered PDF."""
+    inputs = {
+        "version": RENDER_VERSION,
+        "template": [template_name, renderer.fingerprint(template_name)],
+        "invoice": [
+            invoice.id,
+            invoice.invoice_number,
+            invoice.status.value,
+            invoice.currency.value,
+            str(invoice.amount),
+            invoice.issue_date.isoformat(),
+            invoice.due_date.isoformat(),
+            invoice.payment_terms,
+            invoice.notes,
+        ],
+        "line_items": [
+            [item.id, item.description, str(item.quantity), str(item.unit_price), str(item.tax_rate)]
+            for item in invoice.line_items
+        ],
+        "client": [client.id, client.name, client.email, client.phone, client.address, client.tax_id],
+        "user": [
+            user.username,
+            user.email,
+            user.company_name,
+            user.company_address,
+            user.company_city,
+            user.company_country,
+            user.company_phone,
+        ],
+    }
+    payload = json.dumps(inputs, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+async def render_invoice_pdf(
+    invoice: Invoice,
+    client: Client,
+    user: User,
+    template_name: str = "invoice_template.html",
+    render_key: str | None = None,
+) -> bytes:
+    """Get invoice PDF from cache or render it without blocking the event loop."""
+    render_key = render_key or invoice_render_key(invoice, client, user, template_name)
     
-    pdf_bytes = HTML(string=html_content).write_pdf()
+    pdf_bytes = await pdf_cache.get(invoice, render_key)
+    if pdf_bytes is not None:
+        return pdf_bytes
     
+    html_content = renderer.render_html(invoice, client, user, template_name)
+    pdf_bytes = await pdf_executor.run(html_to_pdf, html_content, template_name)
+    await pdf_cache.put(invoice, render_key, pdf_bytes)
     return pdf_bytes
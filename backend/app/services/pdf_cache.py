@@ -0,0 +1,202 @@
+"""Rendered PDF cache."""
+
+import asyncio
+import os
+import shutil
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable
+
+from app.core.config import settings
+from app.core.logging import logger
+from app.core.tasks import PeriodicTask
+from app.models.invoice import Invoice
+
+
+class PDFCache:
+    """LRU cache of rendered PDFs bounded by total size, with an optional disk tier.
+
+    Entries are keyed by a hash of everything that goes into a render, so a
+    stale entry can never be served for changed data. Explicit invalidation
+    only frees space early. Disk entries live under
+    ``<dir>/<user_id>/<client_id>/<invoice_id>-<key>.pdf`` so they can be
+    dropped per user, client or invoice by path, without an index or a scan
+    of the whole tree. Disk I/O runs in worker threads, and ``sweep_disk``
+    bounds the disk tier by age and total size.
+    """
+
+    def __init__(self, max_bytes: int, disk_dir: str = "", disk_max_bytes: int = 0, disk_ttl: float = 0):
+        self.max_bytes = max_bytes
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        self.disk_max_bytes = disk_max_bytes
+        self.disk_ttl = disk_ttl
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+        self._scopes: dict[str, tuple[int, int, int]] = {}
+        self._size = 0
+
+    @staticmethod
+    def _scope(invoice: Invoice) -> tuple[int, int, int]:
+        return invoice.user_id, invoice.client_id, invoice.id
+
+    def _disk_path(self, scope: tuple[int, int, int], key: str) -> Path:
+        user_id, client_id, invoice_id = scope
+        return self.disk_dir / str(user_id) / str(client_id) / f"{invoice_id}-{key}.pdf"
+
+    async def get(self, invoice: Invoice, key: str) -> bytes | None:
+        """Get a cached PDF for an invoice render key."""
+        pdf_bytes = self._entries.get(key)
+        if pdf_bytes is not None:
+            self._entries.move_to_end(key)
+            return pdf_bytes
+
+        if self.disk_dir is None:
+            return None
+
+        scope = self._scope(invoice)
+        pdf_bytes = await asyncio.to_thread(self._read_disk, self._disk_path(scope, key))
+        if pdf_bytes is None:
+            return None
+
+        self._store(key, pdf_bytes, scope)
+        return pdf_bytes
+
+    async def put(self, invoice: Invoice, key: str, pdf_bytes: bytes) -> None:
+        """Cache a rendered PDF."""
+        scope = self._scope(invoice)
+        self._store(key, pdf_bytes, scope)
+
+        if self.disk_dir is not None:
+            await asyncio.to_thread(self._write_disk, self._disk_path(scope, key), pdf_bytes)
+
+    @staticmethod
+    def _read_disk(path: Path) -> bytes | None:
+        try:
+            pdf_bytes = path.read_bytes()
+            # Bump the mtime so the sweep evicts least recently used files first.
+            os.utime(path)
+        except OSError:
+            return None
+        return pdf_bytes
+
+    @staticmethod
+    def _write_disk(path: Path, pdf_bytes: bytes) -> None:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_bytes(pdf_bytes)
+            tmp_path.replace(path)
+        except OSError as e:
+            logger.warning(f"Failed to write PDF cache entry {path}: {str(e)}")
+
+    def _store(self, key: str, pdf_bytes: bytes, scope: tuple[int, int, int]) -> None:
+        if len(pdf_bytes) > self.max_bytes:
+            return
+
+        self._discard(key)
+        self._entries[key] = pdf_bytes
+        self._scopes[key] = scope
+        self._size += len(pdf_bytes)
+
+        while self._size > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._discard(oldest)
+
+    def _discard(self, key: str) -> None:
+        pdf_bytes = self._entries.pop(key, None)
+        if pdf_bytes is not None:
+            self._size -= len(pdf_bytes)
+        self._scopes.pop(key, None)
+
+    def _invalidate_memory(self, matches: Callable[[tuple[int, int, int]], bool]) -> None:
+        for key, scope in list(self._scopes.items()):
+            if matches(scope):
+                self._discard(key)
+
+    @staticmethod
+    def _remove_in_background(func: Callable[..., Any], *args: Any) -> None:
+        """Delete disk entries off the event loop; nothing waits for it."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            func(*args)
+            return
+        loop.run_in_executor(None, func, *args)
+
+    @staticmethod
+    def _remove_invoice_files(directory: Path, invoice_id: int) -> None:
+        for path in directory.glob(f"{invoice_id}-*.pdf"):
+            path.unlink(missing_ok=True)
+
+    def invalidate_user(self, user_id: int) -> None:
+        """Drop all cached PDFs issued by a user."""
+        self._invalidate_memory(lambda scope: scope[0] == user_id)
+        if self.disk_dir is not None:
+            self._remove_in_background(shutil.rmtree, self.disk_dir / str(user_id), True)
+
+    def invalidate_client(self, user_id: int, client_id: int) -> None:
+        """Drop all cached PDFs addressed to a client."""
+        self._invalidate_memory(lambda scope: scope[:2] == (user_id, client_id))
+        if self.disk_dir is not None:
+            self._remove_in_background(shutil.rmtree, self.disk_dir / str(user_id) / str(client_id), True)
+
+    def invalidate_invoice(self, user_id: int, client_id: int, invoice_id: int) -> None:
+        """Drop all cached PDFs of an invoice."""
+        self._invalidate_memory(lambda scope: scope == (user_id, client_id, invoice_id))
+        if self.disk_dir is not None:
+            self._remove_in_background(
+                self._remove_invoice_files, self.disk_dir / str(user_id) / str(client_id), invoice_id
+            )
+
+    def sweep_disk(self) -> int:
+        """Delete disk entries older than the TTL, then the least recently used over the byte cap.
+
+        Blocking; run it in a worker thread. Returns the number of files removed.
+        """
+        if self.disk_dir is None or not self.disk_dir.exists():
+            return 0
+
+        expire_before = time.time() - self.disk_ttl if self.disk_ttl > 0 else None
+        files = []
+        removed = 0
+        for path in self.disk_dir.rglob("*"):
+            try:
+                if not path.is_file():
+                    continue
+                stat = path.stat()
+            except OSError:
+                continue
+            if expire_before is not None and stat.st_mtime < expire_before:
+                path.unlink(missing_ok=True)
+                removed += 1
+            else:
+                files.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in files)
+        if self.disk_max_bytes > 0 and total > self.disk_max_bytes:
+            for _, size, path in sorted(files, key=lambda entry: entry[0]):
+                path.unlink(missing_ok=True)
+                removed += 1
+                total -= size
+                if total <= self.disk_max_bytes:
+                    break
+
+        return removed
+
+pdf_cache = PDFCache(
+    settings.PDF_CACHE_MAX_BYTES,
+    settings.PDF_CACHE_DIR,
+    disk_max_bytes=settings.PDF_CACHE_DISK_MAX_BYTES,
+    disk_ttl=settings.PDF_CACHE_DISK_TTL_SECONDS,
+)
+
+
+async def sweep_pdf_cache() -> int:
+    """Trim the disk tier of the PDF cache."""
+    removed = await asyncio.to_thread(pdf_cache.sweep_disk)
+    if removed:
+        logger.info(f"Removed {removed} PDF cache files from disk")
+    return removed
+
+
+pdf_cache_sweeper = PeriodicTask("pdf-cache-sweeper", settings.PDF_CACHE_SWEEP_INTERVAL_SECONDS, sweep_pdf_cache)
@@ -0,0 +1,167 @@
+"""Invoice reporting service."""
+
+from collections import defaultdict
+from collections.abc import Iterable
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.constants import Currency, InvoiceStatus
+from app.models.client import Client
+from app.models.invoice import Invoice
+from app.models.invoice_aggregate import InvoiceAggregate
+from app.schemas.report import (
+    ClientSummary,
+    CurrencySummary,
+    InvoiceSummaryResponse,
+    MonthSummary,
+    StatusSummary,
+)
+
+AggregateKey = tuple[int, int, InvoiceStatus, Currency, date]
+AggregateEntry = tuple[AggregateKey, Decimal]
+
+OUTSTANDING_STATUSES = {InvoiceStatus.SENT, InvoiceStatus.OVERDUE}
+
+
+def aggregate_key(
+    user_id: int, client_id: int, status: InvoiceStatus, currency: Currency, issue_date: date
+) -> AggregateKey:
+    """Get the aggregate bucket for an invoice's attributes."""
+    return user_id, client_id, status, currency, issue_date.replace(day=1)
+
+
+def invoice_aggregate_entry(invoice: Invoice) -> AggregateEntry:
+    """Get the aggregate bucket an invoice falls into, with its amount."""
+    key = aggregate_key(invoice.user_id, invoice.client_id, invoice.status, invoice.currency, invoice.issue_date)
+    return key, invoice.amount or Decimal("0")
+
+
+async def apply_aggregate_changes(
+    db: AsyncSession,
+    removed: Iterable[AggregateEntry] = (),
+    added: Iterable[AggregateEntry] = (),
+) -> None:
+    """Move invoices out of and into aggregate buckets with a single upsert.
+
+    Pass the entries of invoices as they were before a change in
+    ``removed`` and as they are after it in ``added``; unchanged buckets
+    cancel out and are not written.
+    """
+    deltas: dict[AggregateKey, list] = defaultdict(lambda: [0, Decimal("0")])
+    for key, amount in removed:
+        deltas[key][0] -= 1
+        deltas[key][1] -= amount
+    for key, amount in added:
+        deltas[key][0] += 1
+        deltas[key][1] += amount
+
+    # Sorted so concurrent writers lock shared rows in the same order.
+    rows = [
+        {
+            "user_id": user_id,
+            "client_id": client_id,
+            "status": status,
+            "currency": currency,
+            "month": month,
+            "invoice_count": count,
+            "total_amount": total,
+        }
+        for (user_id, client_id, status, currency, month), (count, total) in sorted(
+            deltas.items(), key=lambda item: (item[0][0], item[0][1], item[0][2].value, item[0][3].value, item[0][4])
+        )
+        if count or total
+    ]
+    if not rows:
+        return
+
+    stmt = pg_insert(InvoiceAggregate).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[
+            InvoiceAggregate.user_id,
+            InvoiceAggregate.client_id,
+            InvoiceAggregate.status,
+            InvoiceAggregate.currency,
+            InvoiceAggregate.month,
+        ],
+        set_={
+            "invoice_count": InvoiceAggregate.invoice_count + stmt.excluded.invoice_count,
+            "total_amount": InvoiceAggregate.total_amount + stmt.excluded.total_amount,
+        },
+    )
+    await db.execute(stmt)
+
+
+async def get_invoice_summary(db: AsyncSession, user_id: int) -> InvoiceSummaryResponse:
+    """Get invoice totals by status, currency, month and client from the aggregate table."""
+    result = await db.execute(
+        select(InvoiceAggregate, Client.name)
+        .join(Client, Client.id == InvoiceAggregate.client_id)
+        .where(InvoiceAggregate.user_id == user_id, InvoiceAggregate.invoice_count > 0)
+    )
+
+    by_status: dict[tuple, list] = defaultdict(lambda: [0, Decimal("0")])
+    by_month: dict[tuple, list] = defaultdict(lambda: [0, Decimal("0")])
+    by_client: dict[tuple, list] = defaultdict(lambda: [0, Decimal("0")])
+    by_currency: dict[Currency, dict] = defaultdict(
+        lambda: {
+            "invoice_count": 0,
+            "total_amount": Decimal("0"),
+            "revenue": Decimal("0"),
+            "outstanding": Decimal("0"),
+            "overdue": Decimal("0"),
+        }
+    )
+
+    for row, client_name in result.all():
+        for bucket in (
+            by_status[(row.status, row.currency)],
+            by_month[(row.month, row.currency)],
+            by_client[(row.client_id, client_name, row.currency)],
+        ):
+            bucket[0] += row.invoice_count
+            bucket[1] += row.total_amount
+
+        totals = by_currency[row.currency]
+        totals["invoice_count"] += row.invoice_count
+        totals["total_amount"] += row.total_amount
+        if row.status == InvoiceStatus.PAID:
+            totals["revenue"] += row.total_amount
+        if row.status in OUTSTANDING_STATUSES:
+            totals["outstanding"] += row.total_amount
+        if row.status == InvoiceStatus.OVERDUE:
+            totals["overdue"] += row.total_amount
+
+    return InvoiceSummaryResponse(
+        by_currency=[
+            CurrencySummary(currency=currency, **totals)
+            for currency, totals in sorted(by_currency.items(), key=lambda item: item[0].value)
+        ],
+        by_status=[
+            StatusSummary(status=status, currency=currency, invoice_count=count, total_amount=total)
+            for (status, currency), (count, total) in sorted(
+                by_status.items(), key=lambda item: (item[0][0].value, item[0][1].value)
+            )
+        ],
+        by_month=[
+            MonthSummary(month=month, currency=currency, invoice_count=count, total_amount=total)
+            for (month, currency), (count, total) in sorted(
+                by_month.items(), key=lambda item: (item[0][0], item[0][1].value)
+            )
+        ],
+        by_client=[
+            ClientSummary(
+                client_id=client_id,
+                client_name=client_name,
+                currency=currency,
+                invoice_count=count,
+                total_amount=total,
+            )
+            for (client_id, client_name, currency), (count, total) in sorted(
+                by_client.items(), key=lambda item: (-item[1][1], item[0][0], item[0][2].value)
+            )
+        ],
+    )
@@ -1,6 +1,6 @@
 """Template service."""
 
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exceptions import ForbiddenException, NotFoundException
@@ -8,20 +8,22 @@ from app.models.template import Template
 from app.schemas.template import TemplateCreate, TemplateUpdate
 
 
+async def clear_default_template(db: AsyncSession, user_id: int, keep_id: int | None = None) -> None:
+    """Unset the user's default template in one UPDATE, optionally sparing one template."""
+    stmt = update(Template).where(Template.user_id == user_id, Template.is_default == True)
+    if keep_id is not None:
+        stmt = stmt.where(Template.id != keep_id)
+    await db.execute(stmt.values(is_default=False))
+
+
 async def create_template(db: AsyncSession, user_id: int, data: TemplateCreate) -> Template:
     """Create a new template."""
     if data.is_default:
-        result = await db.execute(
-            select(Template).where(Template.user_id == user_id, Template.is_default == True)
-        )
-        existing_default = result.scalar_one_or_none()
-        if existing_default:
-            existing_default.is_default = False
+        await clear_default_template(db, user_id)
     
     template = Template(user_id=user_id, **data.model_dump())
     db.add(template)
     await db.flush()
-    await db.refresh(template)
     return template
 
 
@@ -56,18 +58,12 @@ async def update_template(
     update_data = data.model_dump(exclude_unset=True)
     
     if update_data.get("is_default"):
-        result = await db.execute(
-            select(Template).where(Template.user_id == user_id, Template.is_default == True)
-        )
-        existing_default = result.scalar_one_or_none()
-        if existing_default and existing_default.id != template_id:
-            existing_default.is_default = False
+        await clear_default_template(db, user_id, keep_id=template_id)
     
     for field, value in update_data.items():
         setattr(template, field, value)
     
     await db.flush()
-    await db.refresh(template)
     return template
 
 
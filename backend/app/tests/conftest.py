@@ -0,0 +1,112 @@
+"""Shared test fixtures.
+
+Database tests run against the PostgreSQL database named by
+``TEST_DATABASE_URL`` and are skipped when it is not set. Each test works
+inside a transaction that is rolled back afterwards.
+"""
+
+import os
+
+os.environ.setdefault("SECRET_KEY", "test-secret-key")
+
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.models import Base, Client, User
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+
+
+@pytest.fixture
+async def engine():
+    """Engine for the test database, with the schema created."""
+    if not TEST_DATABASE_URL:
+        pytest.skip("TEST_DATABASE_URL is not set")
+
+    engine = create_async_engine(TEST_DATABASE_URL)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+async def connection(engine):
+    """Connection whose transaction is rolled back after the test."""
+    async with engine.connect() as conn:
+        transaction = await conn.begin()
+        yield conn
+        await transaction.rollback()
+
+
+@pytest.fixture
+async def db(connection):
+    """Session bound to the test transaction."""
+    async with AsyncSession(bind=connection, expire_on_commit=False) as session:
+        yield session
+
+
+@pytest.fixture
+def count_statements(engine):
+    """Context manager collecting the SQL the engine sends while it is open.
+
+    Statements are recorded as sent; COMMIT and ROLLBACK are recorded as
+    those words, since the driver does not send them through a cursor.
+    """
+    logs: list[list[str]] = []
+
+    def record(statement: str) -> None:
+        for log in logs:
+            log.append(statement)
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        record(statement)
+
+    def commit(conn):
+        record("COMMIT")
+
+    def rollback(conn):
+        record("ROLLBACK")
+
+    listeners = [
+        ("before_cursor_execute", before_cursor_execute),
+        ("commit", commit),
+        ("rollback", rollback),
+    ]
+    for name, listener in listeners:
+        event.listen(engine.sync_engine, name, listener)
+
+    @contextmanager
+    def count():
+        log: list[str] = []
+        logs.append(log)
+        try:
+            yield log
+        finally:
+            logs.remove(log)
+
+    yield count
+
+    for name, listener in listeners:
+        event.remove(engine.sync_engine, name, listener)
+
+
+@pytest.fixture
+async def user(db):
+    """A user to own the test data."""
+    user = User(username="owner", email="owner@example.com", hashed_password="x")
+    db.add(user)
+    await db.flush()
+    return user
+
+
+@pytest.fixture
+async def client(db, user):
+    """A client of the test user."""
+    client = Client(user_id=user.id, name="Acme Ltd", email="billing@acme.example")
+    db.add(client)
+    await db.flush()
+    return client
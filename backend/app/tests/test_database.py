@@ -0,0 +1,63 @@
+"""Tests for request-scoped database sessions."""
+
+import pytest
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core import database
+from app.models import User
+
+
+@pytest.fixture
+def session_factory(engine, monkeypatch):
+    """Point get_db at the test database."""
+    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    monkeypatch.setattr(database, "AsyncSessionLocal", factory)
+    return factory
+
+
+async def run_request(handler) -> None:
+    """Drive get_db the way FastAPI does for one request."""
+    dependency = database.get_db()
+    session = await anext(dependency)
+    await handler(session)
+    with pytest.raises(StopAsyncIteration):
+        await anext(dependency)
+
+
+async def test_read_only_request_does_not_commit(session_factory, count_statements):
+    async def handler(session):
+        await session.execute(select(User).where(User.email == "nobody@example.com"))
+
+    with count_statements() as statements:
+        await run_request(handler)
+
+    assert "COMMIT" not in statements
+    assert statements[-1] == "ROLLBACK"
+
+
+async def test_write_statement_commits(session_factory, count_statements):
+    async def handler(session):
+        await session.execute(update(User).where(User.id == -1).values(is_active=False))
+
+    with count_statements() as statements:
+        await run_request(handler)
+
+    assert "COMMIT" in statements
+
+
+async def test_pending_objects_commit(session_factory, count_statements):
+    async def handler(session):
+        user = await session.get(User, -1)
+        assert user is None
+        session.add(User(username="committed", email="committed@example.com", hashed_password="x"))
+
+    with count_statements() as statements:
+        await run_request(handler)
+
+    assert "COMMIT" in statements
+
+    async with session_factory() as session:
+        user = (await session.execute(select(User).where(User.username == "committed"))).scalar_one()
+        await session.delete(user)
+        await session.commit()
@@ -0,0 +1,55 @@
+"""Tests for the outbound email queue."""
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.constants import EmailJobStatus
+from app.models import EmailJob
+from app.services import email_queue
+from app.services.invoice import create_invoice
+from app.tests.test_statement_budgets import invoice_data
+
+
+class FailingTransport:
+    """Transport whose whole batch call fails, like an open circuit breaker."""
+
+    async def send_batch(self, messages: list[dict]) -> list:
+        raise ConnectionError("upstream unavailable")
+
+
+@pytest.fixture
+def worker_sessions(connection, monkeypatch):
+    """Run the worker's sessions inside the test transaction."""
+    factory = async_sessionmaker(
+        bind=connection,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    )
+    monkeypatch.setattr(email_queue, "AsyncSessionLocal", factory)
+    return factory
+
+
+async def test_failed_batch_send_schedules_retries(db, user, client, worker_sessions, monkeypatch):
+    async def render(*args, **kwargs) -> bytes:
+        return b"%PDF-1.7"
+
+    monkeypatch.setattr(email_queue, "render_invoice_pdf", render)
+    monkeypatch.setattr(email_queue, "get_email_transport", FailingTransport)
+
+    invoice = await create_invoice(db, user.id, invoice_data(client.id))
+    job = EmailJob(user_id=user.id, invoice_id=invoice.id, max_attempts=3, next_attempt_at=datetime.utcnow())
+    db.add(job)
+    await db.flush()
+    job_id = job.id
+    db.expunge_all()
+
+    assert await email_queue.process_email_job_batch() == 1
+
+    job = await db.get(EmailJob, job_id)
+    assert job.status == EmailJobStatus.PENDING
+    assert job.attempts == 1
+    assert job.next_attempt_at > datetime.utcnow()
+    assert "upstream unavailable" in job.last_error
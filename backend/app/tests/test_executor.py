@@ -0,0 +1,56 @@
+"""Tests for the bounded worker pools."""
+
+import os
+import time
+
+import pytest
+
+from app.core.exceptions import ServiceUnavailableException
+from app.core.executor import BoundedExecutor
+
+
+def answer() -> int:
+    return 42
+
+
+def crash() -> None:
+    os._exit(1)
+
+
+async def test_broken_process_pool_is_rebuilt():
+    executor = BoundedExecutor("test pool", max_workers=1, max_pending=1, timeout=30, use_processes=True)
+    try:
+        with pytest.raises(ServiceUnavailableException):
+            await executor.run(crash)
+
+        assert await executor.run(answer) == 42
+        assert executor.in_flight == 0
+    finally:
+        executor.shutdown()
+
+
+async def test_failing_initializer_is_reported_as_unavailable():
+    executor = BoundedExecutor(
+        "test pool", max_workers=1, max_pending=1, timeout=30, use_processes=True, initializer=crash
+    )
+    try:
+        await executor.warm_up()
+
+        with pytest.raises(ServiceUnavailableException, match="unavailable"):
+            await executor.run(answer)
+        assert executor.in_flight == 0
+    finally:
+        executor.shutdown()
+
+
+async def test_timed_out_job_keeps_its_slot():
+    executor = BoundedExecutor("test pool", max_workers=1, max_pending=0, timeout=0.05)
+    try:
+        with pytest.raises(ServiceUnavailableException):
+            await executor.run(time.sleep, 0.5)
+
+        assert executor.in_flight == 1
+        with pytest.raises(ServiceUnavailableException, match="busy"):
+            await executor.run(answer)
+    finally:
+        executor.shutdown()
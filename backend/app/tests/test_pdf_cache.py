@@ -0,0 +1,48 @@
+"""Disk tier of the rendered PDF cache."""
+
+import asyncio
+import os
+import time
+
+from app.models import Invoice
+from app.services.pdf_cache import PDFCache
+
+
+def make_invoice(invoice_id: int, user_id: int = 1, client_id: int = 10) -> Invoice:
+    return Invoice(id=invoice_id, user_id=user_id, client_id=client_id)
+
+
+async def test_disk_round_trip(tmp_path):
+    invoice = make_invoice(1)
+    await PDFCache(1024, str(tmp_path)).put(invoice, "k1", b"%PDF-1")
+
+    # A fresh cache has nothing in memory, so this reads from disk.
+    assert await PDFCache(1024, str(tmp_path)).get(invoice, "k1") == b"%PDF-1"
+    assert (tmp_path / "1" / "10" / "1-k1.pdf").exists()
+
+
+def test_invalidate_invoice_leaves_other_invoices(tmp_path):
+    cache = PDFCache(1024, str(tmp_path))
+    asyncio.run(cache.put(make_invoice(1), "k1", b"one"))
+    asyncio.run(cache.put(make_invoice(2), "k2", b"two"))
+
+    # Outside an event loop the disk removal runs inline.
+    cache.invalidate_invoice(1, 10, 1)
+
+    assert list(cache._entries) == ["k2"]
+    assert [path.name for path in (tmp_path / "1" / "10").iterdir()] == ["2-k2.pdf"]
+
+
+def test_sweep_disk_enforces_ttl_and_byte_cap(tmp_path):
+    directory = tmp_path / "1" / "10"
+    directory.mkdir(parents=True)
+    now = time.time()
+    for name, age in [("expired", 10_000), ("old", 300), ("recent", 200), ("newest", 100)]:
+        path = directory / f"{name}.pdf"
+        path.write_bytes(b"x" * 100)
+        os.utime(path, (now - age, now - age))
+
+    cache = PDFCache(1024, str(tmp_path), disk_max_bytes=250, disk_ttl=1_000)
+
+    assert cache.sweep_disk() == 2
+    assert sorted(path.name for path in directory.iterdir()) == ["newest.pdf", "recent.pdf"]
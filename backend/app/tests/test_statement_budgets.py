@@ -0,0 +1,106 @@
+"""Statement budgets of the service write paths.
+
+Each test runs one service call on a session with nothing loaded and
+asserts how many SQL statements it sends, so a reintroduced refresh after
+flush, or a lookup repeated per row, fails here.
+"""
+
+from datetime import date, timedelta
+from decimal import Decimal
+
+from app.models import Template
+from app.schemas.client import ClientCreate
+from app.schemas.invoice import InvoiceCreate, InvoiceUpdate, LineItemCreate, LineItemUpdate
+from app.schemas.template import TemplateUpdate
+from app.services.client import create_client
+from app.services.invoice import create_invoice, update_invoice
+from app.services.template import update_template
+
+
+def invoice_data(client_id: int) -> InvoiceCreate:
+    """Build a two-line invoice for the client."""
+    return InvoiceCreate(
+        client_id=client_id,
+        issue_date=date.today(),
+        due_date=date.today() + timedelta(days=30),
+        line_items=[
+            LineItemCreate(description="Design", quantity=Decimal("2"), unit_price=Decimal("150")),
+            LineItemCreate(description="Hosting", quantity=Decimal("1"), unit_price=Decimal("20"), tax_rate=Decimal("7.5")),
+        ],
+    )
+
+
+async def test_create_invoice_budget(db, user, client, count_statements):
+    # Invoice number upsert, invoice INSERT and one batched line item INSERT,
+    # plus two statements beyond a bare insert: the client SELECT, which
+    # checks ownership and loads the client for the response, and the
+    # dashboard aggregate upsert. Hence 5 rather than 3.
+    db.expunge_all()
+
+    with count_statements() as statements:
+        invoice = await create_invoice(db, user.id, invoice_data(client.id))
+
+    assert len(statements) == 5
+    assert invoice.id is not None
+    assert [item.total for item in invoice.line_items] == [Decimal("300.00"), Decimal("21.50")]
+    assert invoice.amount == Decimal("321.50")
+
+
+async def test_update_invoice_budget(db, user, client, count_statements):
+    # Invoice (locked), line item and client SELECTs, then the invoice
+    # UPDATE. Status, amount and dates are unchanged, so the aggregates
+    # are not touched.
+    invoice = await create_invoice(db, user.id, invoice_data(client.id))
+    db.expunge_all()
+
+    with count_statements() as statements:
+        await update_invoice(db, user.id, invoice.id, InvoiceUpdate(notes="Net 30"))
+
+    assert len(statements) == 4
+    assert not any(statement.lstrip().startswith("INSERT INTO invoice_aggregates") for statement in statements)
+
+
+async def test_update_invoice_line_items_budget(db, user, client, count_statements):
+    # The three SELECTs and the invoice UPDATE, one statement per kind of
+    # line item change (INSERT, UPDATE, DELETE), and the aggregate upsert
+    # since the amount changed.
+    invoice = await create_invoice(db, user.id, invoice_data(client.id))
+    kept, _removed = invoice.line_items
+    db.expunge_all()
+
+    with count_statements() as statements:
+        invoice = await update_invoice(db, user.id, invoice.id, InvoiceUpdate(
+            line_items=[
+                LineItemUpdate(id=kept.id, description="Design", quantity=Decimal("3"), unit_price=Decimal("150")),
+                LineItemUpdate(description="Support", quantity=Decimal("1"), unit_price=Decimal("80")),
+            ],
+        ))
+
+    assert len(statements) == 8
+    assert invoice.amount == Decimal("530.00")
+
+
+async def test_create_client_budget(db, user, count_statements):
+    with count_statements() as statements:
+        client = await create_client(db, user.id, ClientCreate(name="Globex", email="ap@globex.example"))
+
+    assert len(statements) == 1
+    assert client.id is not None
+    assert client.created_at is not None
+
+
+async def test_update_template_budget(db, user, count_statements):
+    # Template SELECT, clearing the old default and the template UPDATE.
+    old_default = Template(user_id=user.id, name="Old default", is_default=True)
+    new_default = Template(user_id=user.id, name="New default")
+    db.add_all([old_default, new_default])
+    await db.flush()
+    old_default_id, new_default_id = old_default.id, new_default.id
+    db.expunge_all()
+
+    with count_statements() as statements:
+        template = await update_template(db, user.id, new_default_id, TemplateUpdate(is_default=True))
+
+    assert len(statements) == 3
+    assert template.is_default
+    assert not (await db.get(Template, old_default_id)).is_default
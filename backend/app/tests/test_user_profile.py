@@ -0,0 +1,32 @@
+"""Profile reads served from the user cache."""
+
+from app.routes.auth import get_current_user
+from app.services.auth import get_user_by_id, user_cache
+
+
+async def test_me_is_served_from_cache(db, user, count_statements):
+    user_cache.clear()
+    db.expunge_all()
+    await get_user_by_id(db, user.id)
+    db.expunge_all()
+
+    with count_statements() as statements:
+        response = await get_current_user(user.id, db)
+
+    assert statements == []
+    assert response.email == "owner@example.com"
+    assert response.is_active
+    user_cache.clear()
+
+
+async def test_me_reads_the_row_on_a_cache_miss(db, user, count_statements):
+    user_cache.clear()
+    db.expunge_all()
+
+    with count_statements() as statements:
+        response = await get_current_user(user.id, db)
+
+    assert len(statements) == 1
+    assert response.username == "owner"
+    assert user_cache.get(user.id) is not None
+    user_cache.clear()
@@ -5,7 +5,9 @@ from app.utils.auth import (
     create_refresh_token,
     decode_token,
     hash_password,
+    hash_password_async,
     verify_password,
+    verify_password_async,
 )
 from app.utils.jwt import CurrentUser, get_current_user_id
 from app.utils.pagination import PaginatedResponse, PaginationParams
@@ -13,6 +15,8 @@ from app.utils.pagination import PaginatedResponse, PaginationParams
 __all__ = [
     "hash_password",
     "verify_password",
+    "hash_password_async",
+    "verify_password_async",
     "create_access_token",
     "create_refresh_token",
     "decode_token",
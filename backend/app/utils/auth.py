@@ -1,14 +1,32 @@
 """Authentication utilities."""
 
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
+from typing import Protocol
 
 from argon2 import PasswordHasher
 from argon2.exceptions import VerifyMismatchError
-from jose import JWTError, jwt
+from jose import JWTError
+from jose import jwt as jose_jwt
 
 from app.core.config import settings
+from app.core.executor import BoundedExecutor
 
-ph = PasswordHasher()
+ph = PasswordHasher(
+    time_cost=settings.ARGON2_TIME_COST,
+    memory_cost=settings.ARGON2_MEMORY_COST,
+    parallelism=settings.ARGON2_PARALLELISM,
+)
+
+# argon2-cffi releases the GIL while hashing, so threads are enough; the
+# worker count caps how much hashing memory is in use at once.
+password_executor = BoundedExecutor(
+    "password hashing",
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+    timeout=settings.PASSWORD_HASH_TIMEOUT_SECONDS,
+)
 
 
 def hash_password(password: str) -> str:
@@ -25,12 +43,138 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         return False
 
 
+def password_needs_rehash(hashed_password: str) -> bool:
+    """Check whether a hash was made with different Argon2 parameters than the current ones."""
+    return ph.check_needs_rehash(hashed_password)
+
+
+async def hash_password_async(password: str) -> str:
+    """Hash a password in the password hashing pool."""
+    return await password_executor.run(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password in the password hashing pool."""
+    return await password_executor.run(verify_password, plain_password, hashed_password)
+
+
+class JWTBackend(Protocol):
+    """Signs and verifies JWTs."""
+
+    def encode(self, claims: dict) -> str:
+        """Sign claims into a token."""
+        ...
+
+    def decode(self, token: str) -> dict | None:
+        """Verify a token and return its claims, or None if it is invalid or expired."""
+        ...
+
+
+class JoseBackend:
+    """JWT backend using python-jose."""
+
+    def encode(self, claims: dict) -> str:
+        return jose_jwt.encode(claims, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+
+    def decode(self, token: str) -> dict | None:
+        try:
+            return jose_jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        except JWTError:
+            return None
+
+
+class PyJWTBackend:
+    """JWT backend using PyJWT, which verifies noticeably faster than python-jose.
+
+    Requires the optional ``pyjwt`` extra.
+    """
+
+    def __init__(self):
+        try:
+            import jwt
+        except ImportError:
+            raise RuntimeError("JWT_BACKEND=pyjwt requires the PyJWT package (install the pyjwt extra)")
+        self._jwt = jwt
+
+    def encode(self, claims: dict) -> str:
+        return self._jwt.encode(claims, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+
+    def decode(self, token: str) -> dict | None:
+        try:
+            return self._jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        except self._jwt.PyJWTError:
+            return None
+
+
+def create_jwt_backend(name: str) -> JWTBackend:
+    """Create a JWT backend by name."""
+    if name == "jose":
+        return JoseBackend()
+    if name == "pyjwt":
+        return PyJWTBackend()
+    raise ValueError(f"Unknown JWT backend: {name}")
+
+
+class TokenCache:
+    """Bounded LRU cache of verified token claims.
+
+    Entries are dropped when their token's ``exp`` passes, so a cached token
+    is never accepted after it would have failed verification. Only valid
+    tokens are cached. Claims are copied in and out, so callers may change
+    the dict they get without affecting later lookups.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[dict, float]] = OrderedDict()
+
+    def get(self, token: str) -> dict | None:
+        """Get the cached claims of a token that has not expired."""
+        entry = self._entries.get(token)
+        if entry is None:
+            return None
+        
+        payload, expires_at = entry
+        if expires_at <= time.time():
+            del self._entries[token]
+            return None
+        
+        self._entries.move_to_end(token)
+        return dict(payload)
+
+    def put(self, token: str, payload: dict) -> None:
+        """Cache the claims of a verified token."""
+        expires_at = payload.get("exp")
+        if self.max_entries <= 0 or expires_at is None:
+            return
+        
+        self._entries[token] = (dict(payload), float(expires_at))
+        self._entries.move_to_end(token)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Forget every cached token."""
+        self._entries.clear()
+
+
+jwt_backend: JWTBackend = create_jwt_backend(settings.JWT_BACKEND)
+token_cache = TokenCache(settings.TOKEN_CACHE_MAX_ENTRIES)
+
+
+def set_jwt_backend(backend: JWTBackend) -> None:
+    """Replace the active JWT backend, dropping tokens verified by the old one."""
+    global jwt_backend
+    jwt_backend = backend
+    token_cache.clear()
+
+
 def create_access_token(data: dict) -> str:
     """Create JWT access token."""
     to_encode = data.copy()
     expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     to_encode.update({"exp": expire, "type": "access"})
-    return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    return jwt_backend.encode(to_encode)
 
 
 def create_refresh_token(data: dict) -> str:
@@ -38,14 +182,16 @@ def create_refresh_token(data: dict) -> str:
     to_encode = data.copy()
     expire = datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
     to_encode.update({"exp": expire, "type": "refresh"})
-    return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    return jwt_backend.encode(to_encode)
 
 
-def decode_token(token: str) -> dict:
-    """Decode and verify JWT token."""
-    try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+def decode_token(token: str) -> dict | None:
+    """Decode and verify JWT token, reusing the result for tokens seen before."""
+    payload = token_cache.get(token)
+    if payload is not None:
         return payload
-    except JWTError:
-        return None
-
+    
+    payload = jwt_backend.decode(token)
+    if payload is not None:
+        token_cache.put(token, payload)
+    return payload
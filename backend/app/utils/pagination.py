@@ -1,17 +1,31 @@
 """Pagination utilities."""
 
-from typing import Generic, TypeVar
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Generic, Sequence, TypeVar
 
 from pydantic import BaseModel
+from sqlalchemy import Select, tuple_
+
+from app.core.exceptions import BadRequestException
 
 T = TypeVar("T")
 
 
 class PaginationParams(BaseModel):
-    """Pagination parameters."""
+    """Pagination parameters.
+
+    When ``cursor`` is set, the page starts right after the row the cursor
+    points to and ``page`` is ignored, so deep pages cost the same as the
+    first one.
+    """
 
     page: int = 1
     page_size: int = 10
+    cursor: str | None = None
+    include_total: bool = True
 
     @property
     def offset(self) -> int:
@@ -28,19 +42,66 @@ class PaginatedResponse(BaseModel, Generic[T]):
     """Paginated response wrapper."""
 
     items: list[T]
-    total: int
+    total: int | None
     page: int
     page_size: int
-    total_pages: int
+    total_pages: int | None
+    next_cursor: str | None = None
 
     @classmethod
-    def create(cls, items: list[T], total: int, page: int, page_size: int):
+    def create(
+        cls,
+        items: list[T],
+        total: int | None,
+        page: int,
+        page_size: int,
+        next_cursor: str | None = None,
+    ):
         """Create paginated response."""
-        total_pages = (total + page_size - 1) // page_size
+        total_pages = (total + page_size - 1) // page_size if total is not None else None
         return cls(
             items=items,
             total=total,
             page=page,
             page_size=page_size,
             total_pages=total_pages,
+            next_cursor=next_cursor,
         )
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    """Encode a keyset position as an opaque cursor."""
+    payload = json.dumps([created_at.isoformat(), row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """Decode an opaque cursor into a keyset position."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (binascii.Error, ValueError, TypeError):
+        raise BadRequestException("Invalid pagination cursor")
+
+
+def apply_pagination(query: Select, pagination: PaginationParams, created_at_column: Any, id_column: Any) -> Select:
+    """Order newest first and select one page, plus one row to detect a next page."""
+    query = query.order_by(created_at_column.desc(), id_column.desc())
+
+    if pagination.cursor:
+        created_at, row_id = decode_cursor(pagination.cursor)
+        query = query.where(tuple_(created_at_column, id_column) < (created_at, row_id))
+    else:
+        query = query.offset(pagination.offset)
+
+    return query.limit(pagination.limit + 1)
+
+
+def split_page(rows: Sequence[T], pagination: PaginationParams) -> tuple[list[T], str | None]:
+    """Trim the look-ahead row and build the cursor for the next page."""
+    items = list(rows[:pagination.limit])
+    if len(rows) <= pagination.limit:
+        return items, None
+    last = items[-1]
+    return items, encode_cursor(last.created_at, last.id)
@@ -0,0 +1,44 @@
+"""20261017_110000_add invoice_counters
+
+Revision ID: 1129d632205b
+Revises: c41cb7cbd93a
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '1129d632205b'
+down_revision = 'c41cb7cbd93a'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('invoice_counters',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('year', sa.Integer(), nullable=False),
+    sa.Column('last_value', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id', 'year')
+    )
+    # Continue numbering after the highest number already issued per user and year.
+    op.execute("""
+        INSERT INTO invoice_counters (user_id, year, last_value)
+        SELECT user_id,
+               CAST(split_part(invoice_number, '-', 2) AS INTEGER),
+               MAX(CAST(split_part(invoice_number, '-', 3) AS INTEGER))
+        FROM invoices
+        WHERE invoice_number ~ '^INV-[0-9]{4}-[0-9]+$'
+        GROUP BY user_id, split_part(invoice_number, '-', 2)
+    """)
+    op.drop_index('ix_invoices_invoice_number', table_name='invoices')
+    op.create_unique_constraint('uq_invoices_user_id_invoice_number', 'invoices', ['user_id', 'invoice_number'])
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_invoices_user_id_invoice_number', 'invoices', type_='unique')
+    op.create_index('ix_invoices_invoice_number', 'invoices', ['invoice_number'], unique=True)
+    op.drop_table('invoice_counters')
@@ -0,0 +1,43 @@
+"""20261017_130000_add invoice_aggregates
+
+Revision ID: 612cb4f1f58f
+Revises: 85cff533af29
+Create Date: 2026-10-17 13:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '612cb4f1f58f'
+down_revision = '85cff533af29'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('invoice_aggregates',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('client_id', sa.Integer(), nullable=False),
+    sa.Column('status', postgresql.ENUM(name='invoicestatus', create_type=False), nullable=False),
+    sa.Column('currency', postgresql.ENUM(name='currency', create_type=False), nullable=False),
+    sa.Column('month', sa.Date(), nullable=False),
+    sa.Column('invoice_count', sa.Integer(), nullable=False),
+    sa.Column('total_amount', sa.Numeric(precision=14, scale=2), nullable=False),
+    sa.ForeignKeyConstraint(['client_id'], ['clients.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id', 'client_id', 'status', 'currency', 'month')
+    )
+    op.execute("""
+        INSERT INTO invoice_aggregates (user_id, client_id, status, currency, month, invoice_count, total_amount)
+        SELECT user_id, client_id, status, currency, date_trunc('month', issue_date)::date,
+               count(*), coalesce(sum(amount), 0)
+        FROM invoices
+        GROUP BY user_id, client_id, status, currency, date_trunc('month', issue_date)::date
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('invoice_aggregates')
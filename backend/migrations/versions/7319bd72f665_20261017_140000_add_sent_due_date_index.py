@@ -0,0 +1,24 @@
+"""20261017_140000_add sent due date index
+
+Revision ID: 7319bd72f665
+Revises: 612cb4f1f58f
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7319bd72f665'
+down_revision = '612cb4f1f58f'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_invoices_sent_due_date', 'invoices', ['due_date'], unique=False, postgresql_where=sa.text("status = 'SENT'"))
+
+
+def downgrade() -> None:
+    op.drop_index('ix_invoices_sent_due_date', table_name='invoices', postgresql_where=sa.text("status = 'SENT'"))
@@ -0,0 +1,36 @@
+"""20261017_120000_add hot query indexes
+
+Revision ID: 85cff533af29
+Revises: 1129d632205b
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '85cff533af29'
+down_revision = '1129d632205b'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_invoices_user_id_status_issue_date', 'invoices', ['user_id', 'status', 'issue_date'], unique=False)
+    op.create_index('ix_invoices_user_id_created_at_id', 'invoices', ['user_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_invoices_user_id_client_id_issue_date', 'invoices', ['user_id', 'client_id', 'issue_date'], unique=False)
+    op.create_index(op.f('ix_invoices_client_id'), 'invoices', ['client_id'], unique=False)
+    op.create_index('ix_clients_user_id_created_at_id', 'clients', ['user_id', 'created_at', 'id'], unique=False)
+    op.create_index(op.f('ix_line_items_invoice_id'), 'line_items', ['invoice_id'], unique=False)
+    op.create_index('ix_templates_user_id_is_default', 'templates', ['user_id', 'is_default'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_templates_user_id_is_default', table_name='templates')
+    op.drop_index(op.f('ix_line_items_invoice_id'), table_name='line_items')
+    op.drop_index('ix_clients_user_id_created_at_id', table_name='clients')
+    op.drop_index(op.f('ix_invoices_client_id'), table_name='invoices')
+    op.drop_index('ix_invoices_user_id_client_id_issue_date', table_name='invoices')
+    op.drop_index('ix_invoices_user_id_created_at_id', table_name='invoices')
+    op.drop_index('ix_invoices_user_id_status_issue_date', table_name='invoices')
@@ -0,0 +1,34 @@
+"""20261017_160000_widen invoice totals
+
+Revision ID: b4a163199064
+Revises: ccd26105fcf0
+Create Date: 2026-10-17 16:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b4a163199064'
+down_revision = 'ccd26105fcf0'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    for column in ('subtotal', 'tax_total', 'amount'):
+        op.alter_column(
+            'invoices', column,
+            existing_type=sa.Numeric(precision=10, scale=2),
+            type_=sa.Numeric(precision=12, scale=2),
+        )
+
+
+def downgrade() -> None:
+    for column in ('subtotal', 'tax_total', 'amount'):
+        op.alter_column(
+            'invoices', column,
+            existing_type=sa.Numeric(precision=12, scale=2),
+            type_=sa.Numeric(precision=10, scale=2),
+        )
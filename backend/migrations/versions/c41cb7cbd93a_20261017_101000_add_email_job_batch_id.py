@@ -0,0 +1,26 @@
+"""20261017_101000_add email_jobs.batch_id
+
+Revision ID: c41cb7cbd93a
+Revises: c66d7d4d5c3f
+Create Date: 2026-10-17 10:10:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c41cb7cbd93a'
+down_revision = 'c66d7d4d5c3f'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('email_jobs', sa.Column('batch_id', sa.String(length=32), nullable=True))
+    op.create_index(op.f('ix_email_jobs_batch_id'), 'email_jobs', ['batch_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_email_jobs_batch_id'), table_name='email_jobs')
+    op.drop_column('email_jobs', 'batch_id')
@@ -0,0 +1,47 @@
+"""20261017_091500_add email_jobs
+
+Revision ID: c66d7d4d5c3f
+Revises: 1bad3c6f18c1
+Create Date: 2026-10-17 09:15:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c66d7d4d5c3f'
+down_revision = '1bad3c6f18c1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('email_jobs',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('invoice_id', sa.Integer(), nullable=False),
+    sa.Column('status', sa.Enum('PENDING', 'SENDING', 'SENT', 'DEAD', name='emailjobstatus'), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('max_attempts', sa.Integer(), nullable=False),
+    sa.Column('next_attempt_at', sa.DateTime(), nullable=False),
+    sa.Column('last_error', sa.Text(), nullable=True),
+    sa.Column('provider_message_id', sa.String(length=255), nullable=True),
+    sa.Column('sent_at', sa.DateTime(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['invoice_id'], ['invoices.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_email_jobs_id'), 'email_jobs', ['id'], unique=False)
+    op.create_index(op.f('ix_email_jobs_user_id'), 'email_jobs', ['user_id'], unique=False)
+    op.create_index('ix_email_jobs_status_next_attempt_at', 'email_jobs', ['status', 'next_attempt_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_email_jobs_status_next_attempt_at', table_name='email_jobs')
+    op.drop_index(op.f('ix_email_jobs_user_id'), table_name='email_jobs')
+    op.drop_index(op.f('ix_email_jobs_id'), table_name='email_jobs')
+    op.drop_table('email_jobs')
+    sa.Enum(name='emailjobstatus').drop(op.get_bind(), checkfirst=True)
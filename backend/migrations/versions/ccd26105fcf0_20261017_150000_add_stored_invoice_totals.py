@@ -0,0 +1,69 @@
+"""20261017_150000_add stored invoice totals
+
+Revision ID: ccd26105fcf0
+Revises: 7319bd72f665
+Create Date: 2026-10-17 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'ccd26105fcf0'
+down_revision = '7319bd72f665'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('line_items', sa.Column('subtotal', sa.Numeric(precision=12, scale=2), nullable=True))
+    op.add_column('line_items', sa.Column('tax_amount', sa.Numeric(precision=12, scale=2), nullable=True))
+    op.add_column('line_items', sa.Column('total', sa.Numeric(precision=12, scale=2), nullable=True))
+    op.add_column('invoices', sa.Column('subtotal', sa.Numeric(precision=10, scale=2), nullable=True))
+    op.add_column('invoices', sa.Column('tax_total', sa.Numeric(precision=10, scale=2), nullable=True))
+
+    # Same rounding as the service: subtotal to cents, then tax on the rounded subtotal.
+    op.execute("""
+        UPDATE line_items
+        SET subtotal = round(quantity * unit_price, 2),
+            tax_amount = round(round(quantity * unit_price, 2) * tax_rate / 100, 2)
+    """)
+    op.execute("UPDATE line_items SET total = subtotal + tax_amount")
+    op.execute("""
+        UPDATE invoices i
+        SET subtotal = coalesce(t.subtotal, 0),
+            tax_total = coalesce(t.tax_total, 0),
+            amount = coalesce(t.total, 0)
+        FROM invoices i2
+        LEFT JOIN (
+            SELECT invoice_id, sum(subtotal) AS subtotal, sum(tax_amount) AS tax_total, sum(total) AS total
+            FROM line_items
+            GROUP BY invoice_id
+        ) t ON t.invoice_id = i2.id
+        WHERE i2.id = i.id
+    """)
+
+    # Amounts may have moved by a cent with per-line rounding; rebuild the aggregates.
+    op.execute("DELETE FROM invoice_aggregates")
+    op.execute("""
+        INSERT INTO invoice_aggregates (user_id, client_id, status, currency, month, invoice_count, total_amount)
+        SELECT user_id, client_id, status, currency, date_trunc('month', issue_date)::date,
+               count(*), coalesce(sum(amount), 0)
+        FROM invoices
+        GROUP BY user_id, client_id, status, currency, date_trunc('month', issue_date)::date
+    """)
+
+    op.alter_column('line_items', 'subtotal', nullable=False)
+    op.alter_column('line_items', 'tax_amount', nullable=False)
+    op.alter_column('line_items', 'total', nullable=False)
+    op.alter_column('invoices', 'subtotal', nullable=False)
+    op.alter_column('invoices', 'tax_total', nullable=False)
+
+
+def downgrade() -> None:
+    op.drop_column('invoices', 'tax_total')
+    op.drop_column('invoices', 'subtotal')
+    op.drop_column('line_items', 'total')
+    op.drop_column('line_items', 'tax_amount')
+    op.drop_column('line_items', 'subtotal')
@@ -0,0 +1,93 @@
+"""Measure per-request JWT authentication overhead.
+
+Times ``get_current_user_id`` directly and through a minimal FastAPI app
+driven by concurrent in-process requests, for each available JWT backend
+with the verified-token cache disabled and enabled.
+
+    uv run python scripts/benchmark_auth.py
+    uv run python scripts/benchmark_auth.py --requests 20000 --concurrency 100
+"""
+
+import argparse
+import asyncio
+import time
+
+import httpx
+from fastapi import FastAPI
+from fastapi.security import HTTPAuthorizationCredentials
+
+from app.utils import auth
+from app.utils.jwt import CurrentUser, get_current_user_id
+
+
+def available_backends() -> list[str]:
+    """List the JWT backends that can be loaded here."""
+    names = []
+    for name in ("jose", "pyjwt"):
+        try:
+            auth.create_jwt_backend(name)
+            names.append(name)
+        except RuntimeError:
+            print(f"Skipping {name}: not installed")
+    return names
+
+
+def configure(backend: str, cache_entries: int) -> str:
+    """Switch backend and cache size, returning a fresh access token."""
+    auth.set_jwt_backend(auth.create_jwt_backend(backend))
+    auth.token_cache.max_entries = cache_entries
+    return auth.create_access_token({"sub": "1"})
+
+
+async def bench_dependency(token: str, calls: int) -> float:
+    """Return microseconds per call of the auth dependency alone."""
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+    start = time.perf_counter()
+    for _ in range(calls):
+        await get_current_user_id(credentials)
+    return (time.perf_counter() - start) / calls * 1_000_000
+
+
+async def bench_requests(token: str, requests: int, concurrency: int) -> float:
+    """Return requests per second for an authenticated no-op endpoint."""
+    app = FastAPI()
+
+    @app.get("/me")
+    async def me(user_id: CurrentUser):
+        return {"user_id": user_id}
+
+    headers = {"Authorization": f"Bearer {token}"}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def worker(count: int) -> None:
+            for _ in range(count):
+                response = await client.get("/me", headers=headers)
+                response.raise_for_status()
+
+        per_worker = requests // concurrency
+        start = time.perf_counter()
+        await asyncio.gather(*(worker(per_worker) for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+
+    return per_worker * concurrency / elapsed
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=20000, help="direct dependency calls per run")
+    parser.add_argument("--requests", type=int, default=5000, help="HTTP requests per run")
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+
+    print(f"{'backend':<8} {'cache':<6} {'us/call':>10} {'req/s':>10}")
+    for backend in available_backends():
+        for cache_entries in (0, 10000):
+            token = configure(backend, cache_entries)
+            per_call = await bench_dependency(token, args.calls)
+            throughput = await bench_requests(token, args.requests, args.concurrency)
+            cache = "on" if cache_entries else "off"
+            print(f"{backend:<8} {cache:<6} {per_call:>10.1f} {throughput:>10.0f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
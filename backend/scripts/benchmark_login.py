@@ -0,0 +1,78 @@
+"""Measure password verification throughput and event loop stalls under concurrent logins.
+
+Runs the same burst of concurrent Argon2 verifications twice: inline on the
+event loop (the old behaviour) and through the bounded password hashing
+pool. A heartbeat task ticks every few milliseconds alongside, and its
+worst delay shows how long other requests would have been stalled.
+
+    uv run python scripts/benchmark_login.py
+    uv run python scripts/benchmark_login.py --logins 200 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import time
+
+from app.core.config import settings
+from app.utils.auth import hash_password, password_executor, verify_password, verify_password_async
+
+HEARTBEAT_SECONDS = 0.005
+
+
+async def heartbeat(stop: asyncio.Event) -> float:
+    """Tick until stopped and return the worst scheduling delay in ms."""
+    worst = 0.0
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(HEARTBEAT_SECONDS)
+        worst = max(worst, time.perf_counter() - start - HEARTBEAT_SECONDS)
+    return worst * 1000
+
+
+async def run_burst(verify, hashed: str, logins: int, concurrency: int) -> tuple[float, float]:
+    """Run concurrent verifications and return (logins per second, worst loop stall in ms)."""
+    slots = asyncio.Semaphore(concurrency)
+
+    async def login() -> None:
+        async with slots:
+            assert await verify("correct horse battery staple", hashed)
+
+    stop = asyncio.Event()
+    ticker = asyncio.create_task(heartbeat(stop))
+    await asyncio.sleep(0)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(login() for _ in range(logins)))
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    return logins / elapsed, await ticker
+
+
+async def verify_inline(plain_password: str, hashed_password: str) -> bool:
+    return verify_password(plain_password, hashed_password)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logins", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=20)
+    args = parser.parse_args()
+
+    print(
+        f"Argon2 t={settings.ARGON2_TIME_COST} m={settings.ARGON2_MEMORY_COST}KiB "
+        f"p={settings.ARGON2_PARALLELISM}, pool workers={settings.PASSWORD_HASH_WORKERS}"
+    )
+    hashed = hash_password("correct horse battery staple")
+    password_executor.max_pending = max(password_executor.max_pending, args.concurrency)
+
+    print(f"{'mode':<8} {'logins/s':>10} {'worst stall ms':>15}")
+    for mode, verify in (("inline", verify_inline), ("pool", verify_password_async)):
+        throughput, stall = await run_burst(verify, hashed, args.logins, args.concurrency)
+        print(f"{mode:<8} {throughput:>10.1f} {stall:>15.1f}")
+
+    password_executor.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,213 @@
+"""Compare query plans of hot service queries with and without the composite indexes.
+
+Seeds a synthetic dataset, then runs EXPLAIN ANALYZE for each query shape
+twice: once inside a transaction that drops the indexes (rolled back
+afterwards, since Postgres DDL is transactional) and once with them in
+place. DROP INDEX locks the tables for the duration, so run this against
+a development database only.
+
+    uv run python scripts/benchmark_queries.py --seed --users 20 --invoices 5000
+    uv run python scripts/benchmark_queries.py
+    uv run python scripts/benchmark_queries.py --cleanup
+"""
+
+import argparse
+import asyncio
+import re
+from datetime import date, timedelta
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
+
+from app.core.config import settings
+
+BENCH_PREFIX = "bench_"
+
+INDEXES = [
+    "ix_invoices_user_id_status_issue_date",
+    "ix_invoices_user_id_created_at_id",
+    "ix_invoices_user_id_client_id_issue_date",
+    "ix_invoices_client_id",
+    "ix_clients_user_id_created_at_id",
+    "ix_line_items_invoice_id",
+    "ix_templates_user_id_is_default",
+    "ix_invoices_sent_due_date",
+]
+
+QUERIES = {
+    "invoice list (get_invoices)": """
+        SELECT * FROM invoices
+        WHERE user_id = :user_id
+        ORDER BY created_at DESC, id DESC
+        LIMIT 11
+    """,
+    "invoice list filtered by status and date": """
+        SELECT * FROM invoices
+        WHERE user_id = :user_id AND status = 'SENT' AND issue_date >= :start_date
+        ORDER BY created_at DESC, id DESC
+        LIMIT 11
+    """,
+    "invoice count filtered by status and date": """
+        SELECT count(*) FROM invoices
+        WHERE user_id = :user_id AND status = 'SENT' AND issue_date >= :start_date
+    """,
+    "duplicate check (check_duplicate_invoice)": """
+        SELECT * FROM invoices
+        WHERE user_id = :user_id AND client_id = :client_id
+          AND amount = 100 AND issue_date = :start_date
+    """,
+    "client list (get_clients)": """
+        SELECT * FROM clients
+        WHERE user_id = :user_id
+        ORDER BY created_at DESC, id DESC
+        LIMIT 11
+    """,
+    "line items of an invoice": """
+        SELECT * FROM line_items WHERE invoice_id = :invoice_id
+    """,
+    "default template (get_default_template)": """
+        SELECT * FROM templates WHERE user_id = :user_id AND is_default = true
+    """,
+    "overdue sweep batch (mark_overdue_invoice_batch)": """
+        SELECT id FROM invoices
+        WHERE status = 'SENT' AND due_date < current_date
+        ORDER BY due_date
+        LIMIT 1000
+    """,
+}
+
+
+async def seed(conn: AsyncConnection, users: int, clients: int, invoices: int) -> None:
+    """Insert a synthetic dataset owned by bench_* users."""
+    await conn.execute(text("""
+        INSERT INTO users (username, email, hashed_password, preferred_currency, is_active, created_at, updated_at)
+        SELECT :prefix || g, :prefix || g || '@example.com', 'x', 'NGN', true, now(), now()
+        FROM generate_series(1, :users) g
+    """), {"prefix": BENCH_PREFIX, "users": users})
+
+    await conn.execute(text("""
+        INSERT INTO clients (user_id, name, email, created_at, updated_at)
+        SELECT u.id, 'Client ' || g, 'client' || g || '@example.com',
+               now() - g * interval '1 hour', now()
+        FROM users u, generate_series(1, :clients) g
+        WHERE u.username LIKE :prefix || '%'
+    """), {"prefix": BENCH_PREFIX, "clients": clients})
+
+    await conn.execute(text("""
+        INSERT INTO invoices (user_id, client_id, invoice_number, status, currency, amount,
+                              template_name, issue_date, due_date, created_at, updated_at)
+        SELECT u.id,
+               (SELECT c.id FROM clients c WHERE c.user_id = u.id ORDER BY c.id
+                OFFSET g % :clients LIMIT 1),
+               'BENCH-' || g,
+               (ARRAY['DRAFT', 'SENT', 'PAID', 'OVERDUE', 'CANCELLED'])[1 + g % 5]::invoicestatus,
+               'USD'::currency,
+               (g % 1000) + 0.5,
+               'invoice_template.html',
+               current_date - (g % 730),
+               current_date - (g % 730) + 30,
+               now() - g * interval '1 minute',
+               now()
+        FROM users u, generate_series(1, :invoices) g
+        WHERE u.username LIKE :prefix || '%'
+    """), {"prefix": BENCH_PREFIX, "clients": clients, "invoices": invoices})
+
+    await conn.execute(text("""
+        INSERT INTO line_items (invoice_id, description, quantity, unit_price, tax_rate)
+        SELECT i.id, 'Item ' || g, 1, i.amount / 3, 0
+        FROM invoices i JOIN users u ON u.id = i.user_id, generate_series(1, 3) g
+        WHERE u.username LIKE :prefix || '%'
+    """), {"prefix": BENCH_PREFIX})
+
+    print(f"Seeded {users} users x {invoices} invoices")
+
+
+async def explain_all(conn: AsyncConnection, params: dict) -> dict[str, float]:
+    """Run EXPLAIN ANALYZE for every query and return execution times in ms."""
+    timings = {}
+    for name, sql in QUERIES.items():
+        result = await conn.execute(text(f"EXPLAIN (ANALYZE, BUFFERS) {sql}"), params)
+        plan = [row[0] for row in result]
+        match = re.search(r"Execution Time: ([\d.]+) ms", plan[-1])
+        timings[name] = float(match.group(1)) if match else float("nan")
+        print(f"\n-- {name}")
+        print("\n".join(plan))
+    return timings
+
+
+async def benchmark() -> None:
+    """Print plans and timings without, then with, the indexes."""
+    engine = create_async_engine(settings.DATABASE_URL)
+
+    async with engine.connect() as conn:
+        row = (await conn.execute(text("""
+            SELECT i.user_id, i.client_id, i.id
+            FROM invoices i JOIN users u ON u.id = i.user_id
+            WHERE u.username LIKE :prefix || '%'
+            LIMIT 1
+        """), {"prefix": BENCH_PREFIX})).first()
+        if row is None:
+            print("No benchmark data found, run with --seed first")
+            await engine.dispose()
+            return
+
+        await conn.execute(text("ANALYZE"))
+        await conn.commit()
+
+        params = {
+            "user_id": row.user_id,
+            "client_id": row.client_id,
+            "invoice_id": row.id,
+            "start_date": date.today() - timedelta(days=90),
+        }
+
+        print("=== Without indexes ===")
+        transaction = await conn.begin()
+        for index in INDEXES:
+            await conn.execute(text(f"DROP INDEX IF EXISTS {index}"))
+        before = await explain_all(conn, params)
+        await transaction.rollback()
+
+        print("\n=== With indexes ===")
+        after = await explain_all(conn, params)
+
+    await engine.dispose()
+
+    print(f"\n{'query':<45} {'before ms':>10} {'after ms':>10}")
+    for name in QUERIES:
+        print(f"{name:<45} {before[name]:>10.3f} {after[name]:>10.3f}")
+
+
+async def cleanup() -> None:
+    """Delete the synthetic dataset."""
+    engine = create_async_engine(settings.DATABASE_URL)
+    async with engine.begin() as conn:
+        await conn.execute(text("DELETE FROM users WHERE username LIKE :prefix || '%'"), {"prefix": BENCH_PREFIX})
+    await engine.dispose()
+    print("Benchmark data removed")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seed", action="store_true", help="insert the synthetic dataset first")
+    parser.add_argument("--cleanup", action="store_true", help="delete the synthetic dataset and exit")
+    parser.add_argument("--users", type=int, default=10)
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--invoices", type=int, default=2000, help="invoices per user")
+    args = parser.parse_args()
+
+    if args.cleanup:
+        await cleanup()
+        return
+
+    if args.seed:
+        engine = create_async_engine(settings.DATABASE_URL)
+        async with engine.begin() as conn:
+            await seed(conn, args.users, args.clients, args.invoices)
+        await engine.dispose()
+
+    await benchmark()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,73 @@
+"""Concurrent HTTP load test against a running API.
+
+Logs in once, then fires authenticated GET requests at one or more paths
+from many concurrent workers and reports throughput and latency
+percentiles. Run it against the server started with different database
+settings (for example DB_ECHO=true versus the defaults, or different
+DB_POOL_SIZE values) to compare them.
+
+    uv run python scripts/load_test.py --email me@example.com --password secret
+    uv run python scripts/load_test.py --email me@example.com --password secret \\
+        --path /api/v1/invoices --path /api/v1/clients --requests 5000 --concurrency 100
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+
+async def login(client: httpx.AsyncClient, email: str, password: str) -> str:
+    """Get an access token."""
+    response = await client.post("/api/v1/auth/login", json={"email": email, "password": password})
+    response.raise_for_status()
+    return response.json()["access_token"]
+
+
+async def run(args: argparse.Namespace) -> None:
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=60) as client:
+        token = await login(client, args.email, args.password)
+        headers = {"Authorization": f"Bearer {token}"}
+        paths = args.path or ["/api/v1/invoices"]
+
+        latencies: list[float] = []
+        errors = 0
+        counter = iter(range(args.requests))
+
+        async def worker() -> None:
+            nonlocal errors
+            for n in counter:
+                start = time.perf_counter()
+                response = await client.get(paths[n % len(paths)], headers=headers)
+                latencies.append(time.perf_counter() - start)
+                if response.status_code >= 400:
+                    errors += 1
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+        elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    quantiles = statistics.quantiles(latencies, n=100)
+    print(f"requests:    {len(latencies)} ({errors} errors) in {elapsed:.2f}s")
+    print(f"throughput:  {len(latencies) / elapsed:.1f} req/s")
+    print(f"latency ms:  p50 {quantiles[49] * 1000:.1f}  p95 {quantiles[94] * 1000:.1f}  "
+          f"p99 {quantiles[98] * 1000:.1f}  max {latencies[-1] * 1000:.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--email", required=True)
+    parser.add_argument("--password", required=True)
+    parser.add_argument("--path", action="append", help="path to request, repeatable (default: invoice list)")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
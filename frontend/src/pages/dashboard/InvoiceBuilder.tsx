@@ -17,6 +17,7 @@ import { getCurrencySymbol, formatCurrency } from "@/lib/currency";
 import { get } from "@/lib/api";
 
 interface LineItem {
+  id?: number;
   description: string;
   quantity: number;
   unit_price: number;
@@ -71,6 +72,7 @@ export default function InvoiceBuilder() {
           
           if (invoice.line_items && invoice.line_items.length > 0) {
             setLineItems(invoice.line_items.map((item: any) => ({
+              id: item.id,
               description: item.description,
               quantity: parseFloat(item.quantity),
               unit_price: parseFloat(item.unit_price),
@@ -150,6 +152,7 @@ export default function InvoiceBuilder() {
           notes: notes || undefined,
           payment_terms: paymentTerms || undefined,
           line_items: lineItems.map(item => ({
+            id: item.id,
             description: item.description,
             quantity: item.quantity,
             unit_price: item.unit_price,
@@ -1,7 +1,8 @@
 export interface PaginatedResponse<T> {
   items: T[];
-  total: number;
+  total: number | null;
   page: number;
   page_size: number;
-  total_pages: number;
+  total_pages: number | null;
+  next_cursor?: string | null;
 }
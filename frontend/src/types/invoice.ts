@@ -7,6 +7,9 @@ export interface LineItem {
   quantity: number;
   unit_price: number;
   tax_rate: number;
+  subtotal?: number;
+  tax_amount?: number;
+  total?: number;
 }
 
 export interface ClientBasic {
@@ -23,6 +26,8 @@ export interface Invoice {
   invoice_number: string;
   status: InvoiceStatus;
   currency: Currency;
+  subtotal: number;
+  tax_total: number;
   amount: number;
   issue_date: string;
   due_date: string;